@@ -1,15 +1,32 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optional ahead-of-time build of the chunker with mypyc:
+#   pip install mypy && TTS_GENERATOR_MYPYC=1 pip install .
+# Without the variable the package installs as pure Python.
+ext_modules = []
+if os.environ.get("TTS_GENERATOR_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["tts_generator/chunker.py"])
+
 setup(
     name="tts-generator",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "google-genai>=1.0.0",
         "elevenlabs>=1.0.0",
         "pydub>=0.25.1",
         "rich>=13.0.0",
     ],
+    extras_require={
+        "fast": ["mypy>=1.0"],
+        "mp3": ["lameenc>=1.4"],
+        "json": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "tts-generator=tts_generator.cli:main",
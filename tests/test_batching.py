@@ -0,0 +1,52 @@
+"""Tests for the batching module."""
+
+from tts_generator.batching import fuse_adjacent
+from tts_generator.parser import DialogueLine
+
+
+class TestFuseAdjacent:
+    """Tests for fuse_adjacent function."""
+
+    def test_merges_same_speaker_runs(self):
+        """Test consecutive lines from one speaker become one line."""
+        lines = [
+            DialogueLine("Alice", "Yes."),
+            DialogueLine("Alice", "Of course."),
+            DialogueLine("Bob", "Good."),
+            DialogueLine("Alice", "OK."),
+        ]
+
+        fused = fuse_adjacent(lines)
+
+        assert fused == [
+            DialogueLine("Alice", "Yes. Of course."),
+            DialogueLine("Bob", "Good."),
+            DialogueLine("Alice", "OK."),
+        ]
+        # Input is left untouched
+        assert lines[0].text == "Yes."
+
+    def test_respects_max_bytes(self):
+        """Test runs are split once they would exceed max_bytes."""
+        lines = [DialogueLine("Alice", "x" * 10) for _ in range(3)]
+
+        fused = fuse_adjacent(lines, max_bytes=21)
+
+        assert [line.text_bytes for line in fused] == [21, 10]
+
+    def test_chapter_markers_not_merged(self):
+        """Test chapter markers stay on their own line."""
+        lines = [
+            DialogueLine("Narrator", "The end of part one."),
+            DialogueLine("Narrator", "Chapter 2"),
+            DialogueLine("Narrator", "It began again."),
+        ]
+
+        assert fuse_adjacent(lines) == lines
+
+    def test_merge_never_forms_chapter_marker(self):
+        """Test lines are not fused into text that reads as a chapter marker."""
+        for first, second in [("Chapter", "3 was the best."), ("Section", "2.")]:
+            lines = [DialogueLine("Narrator", first), DialogueLine("Narrator", second)]
+
+            assert fuse_adjacent(lines) == lines
@@ -0,0 +1,90 @@
+"""Tests for the cache module."""
+
+import os
+
+from tts_generator.cache import SegmentCache
+from tts_generator.providers.base import AudioSegment
+
+
+class DummyProvider:
+    """Stand-in provider; only its type and MODEL feed the cache key."""
+
+    MODEL = "dummy-model"
+
+
+class TestSegmentCache:
+    """Tests for SegmentCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test storing and loading an entry."""
+        cache = SegmentCache(tmp_path)
+        audio = AudioSegment(data=b"\x01\x00" * 100, sample_rate=16000)
+
+        cache.put("ab" * 16, audio)
+
+        assert cache.get("ab" * 16) == audio
+
+    def test_missing_entry(self, tmp_path):
+        """Test that an unknown key returns None."""
+        assert SegmentCache(tmp_path).get("cd" * 16) is None
+
+    def test_get_or_compute_calls_once(self, tmp_path):
+        """Test that a second lookup is served from disk."""
+        cache = SegmentCache(tmp_path)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return AudioSegment(data=b"\x00\x00" * 10)
+
+        key = SegmentCache.make_key(DummyProvider(), [("", "Kore", "Yes.")])
+        first = cache.get_or_compute(key, compute)
+        second = cache.get_or_compute(key, compute)
+
+        assert first == second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_inputs(self):
+        """Test that voice, text and style all change the key."""
+        provider = DummyProvider()
+        base = SegmentCache.make_key(provider, [("", "Kore", "Yes.")])
+
+        assert base == SegmentCache.make_key(provider, [("", "Kore", "Yes.")])
+        assert base != SegmentCache.make_key(provider, [("", "Puck", "Yes.")])
+        assert base != SegmentCache.make_key(provider, [("", "Kore", "No.")])
+        assert base != SegmentCache.make_key(provider, [("", "Kore", "Yes.")], "calm")
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        """Test that an entry that cannot be opened is treated as missing."""
+        cache = SegmentCache(tmp_path)
+        key = "ef" * 16
+        # A directory where the entry file should be fails to open with an OSError
+        cache._path(key).mkdir(parents=True)
+
+        assert cache.get(key) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that going over the size cap deletes the oldest-used entries."""
+        audio = AudioSegment(data=b"\x00\x00" * 500)
+        cache = SegmentCache(tmp_path, max_bytes=2500)
+        keys = [f"{i:02x}" * 16 for i in range(3)]
+        for age, key in enumerate(keys[:2]):
+            cache.put(key, audio)
+            os.utime(cache._path(key), (age, age))
+
+        # Reading the older entry makes the other one least recently used
+        assert cache.get(keys[0]) == audio
+        cache.put(keys[2], audio)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == audio
+        assert cache.get(keys[2]) == audio
+
+    def test_clear(self, tmp_path):
+        """Test that clear deletes every entry."""
+        cache = SegmentCache(tmp_path)
+        cache.put("ab" * 16, AudioSegment(data=b"\x00\x00"))
+
+        assert cache.clear() == 1
+        assert cache.get("ab" * 16) is None
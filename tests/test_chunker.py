@@ -103,6 +103,13 @@ class TestIsChapterMarker:
         is_chapter, _ = is_chapter_marker("chapter 1")
         assert is_chapter is True
 
+    def test_non_ascii_titles(self):
+        """Test that non-ASCII titles, spaces and digits still mark chapters."""
+        for text in ("Chapter Único: x", "Section Ünf: y", "Chapter\xa01", "Chapter ١"):
+            is_chapter, title = is_chapter_marker(text)
+            assert is_chapter is True
+            assert title == text
+
 
 class TestTextChunker:
     """Tests for TextChunker class."""
@@ -227,3 +234,42 @@ class TestTextChunker:
 
         assert "Alice" in chunks[0].speakers
         assert "Bob" in chunks[0].speakers
+
+    def test_speakers_in_order_of_appearance(self):
+        """Test that chunk speakers are listed in order of first appearance."""
+        lines = [
+            DialogueLine("Bob", "Hi"),
+            DialogueLine("Alice", "Hello"),
+            DialogueLine("Bob", "How are you?"),
+        ]
+        chunker = TextChunker()
+        chunks = chunker.chunk(lines)
+
+        assert chunks[0].speakers == ["Bob", "Alice"]
+
+    def test_chunk_iter_matches_chunk(self):
+        """Test that chunk_iter yields the same chunks as chunk."""
+        lines = [
+            DialogueLine("Alice", "A" * 100),
+            DialogueLine("Bob", "B" * 100),
+            DialogueLine("Carol", "C" * 100),
+        ]
+        chunker = TextChunker(max_bytes=150)
+
+        iterator = chunker.chunk_iter(lines)
+        first = next(iterator)
+
+        assert first.index == 0
+        assert [first, *iterator] == chunker.chunk(lines)
+
+    def test_long_line_not_chapter(self):
+        """Test that long dialogue starting like a marker does not split."""
+        lines = [
+            DialogueLine("Narrator", "Once upon a time..."),
+            DialogueLine("Narrator", "Chapter 2 " + "of the story was the longest one. " * 5),
+        ]
+        chunker = TextChunker(max_bytes=10000)
+        chunks = chunker.chunk(lines)
+
+        assert len(chunks) == 1
+        assert chunks[0].is_chapter_start is False
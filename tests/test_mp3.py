@@ -0,0 +1,133 @@
+"""Tests for the mp3 module."""
+
+import wave
+
+import pytest
+
+from tts_generator import mp3
+from tts_generator.mp3 import convert_pcm_to_mp3, convert_to_mp3
+
+
+# One second of 24kHz mono 16-bit silence
+PCM = b"\x00\x00" * 24000
+
+
+def install_fake_ffmpeg(tmp_path, monkeypatch, script):
+    """Use a shell-script stand-in for ffmpeg and disable lameenc."""
+    fake_ffmpeg = tmp_path / "ffmpeg"
+    fake_ffmpeg.write_text(f"#!/bin/sh\n{script}\n")
+    fake_ffmpeg.chmod(0o755)
+    monkeypatch.setattr(mp3, "_ffmpeg_path", lambda: str(fake_ffmpeg))
+    monkeypatch.setattr(mp3, "lameenc", None)
+
+
+class TestConvertPcmToMp3:
+    """Tests for convert_pcm_to_mp3 function."""
+
+    def test_encodes_in_process(self, tmp_path):
+        """Test encoding PCM without writing an intermediate WAV."""
+        pytest.importorskip("lameenc")
+        mp3_path = tmp_path / "out.mp3"
+
+        result = convert_pcm_to_mp3(PCM, 24000, 1, mp3_path)
+
+        assert result == mp3_path
+        assert mp3_path.stat().st_size > 0
+        assert not (tmp_path / "out.wav").exists()
+
+    def test_no_encoder_available(self, tmp_path, monkeypatch):
+        """Test error when neither lameenc nor ffmpeg is available."""
+        monkeypatch.setattr(mp3, "lameenc", None)
+        monkeypatch.setattr(mp3, "_ffmpeg_path", lambda: None)
+
+        with pytest.raises(RuntimeError, match="lameenc or ffmpeg"):
+            convert_pcm_to_mp3(PCM, 24000, 1, tmp_path / "out.mp3")
+
+        assert not (tmp_path / "out.wav").exists()
+
+
+class TestConvertToMp3:
+    """Tests for convert_to_mp3 function."""
+
+    def test_converts_and_deletes_wav(self, tmp_path):
+        """Test converting a WAV file and removing it afterwards."""
+        pytest.importorskip("lameenc")
+        wav_path = tmp_path / "in.wav"
+        with wave.open(str(wav_path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(24000)
+            wav.writeframes(PCM)
+
+        mp3_path = convert_to_mp3(wav_path, tmp_path / "out.mp3")
+
+        assert mp3_path.stat().st_size > 0
+        assert not wav_path.exists()
+
+
+class TestMp3Writer:
+    """Tests for Mp3Writer class."""
+
+    def test_incremental_write(self, tmp_path):
+        """Test encoding PCM written in several blocks."""
+        pytest.importorskip("lameenc")
+        mp3_path = tmp_path / "out.mp3"
+
+        with mp3.Mp3Writer(mp3_path, 24000, 1) as writer:
+            for _ in range(3):
+                writer.write(PCM)
+
+        assert mp3_path.stat().st_size > 0
+
+    def test_no_encoder_available(self, tmp_path, monkeypatch):
+        """Test error when neither lameenc nor ffmpeg is available."""
+        monkeypatch.setattr(mp3, "lameenc", None)
+        monkeypatch.setattr(mp3, "_ffmpeg_path", lambda: None)
+
+        assert not mp3.has_streaming_encoder()
+        with pytest.raises(RuntimeError, match="lameenc or ffmpeg"):
+            mp3.Mp3Writer(tmp_path / "out.mp3", 24000, 1)
+
+    def test_ffmpeg_pipe(self, tmp_path, monkeypatch):
+        """Test the ffmpeg fallback receives PCM over stdin."""
+        # Fake ffmpeg that copies stdin to its last argument
+        install_fake_ffmpeg(tmp_path, monkeypatch, 'for last; do :; done\ncat > "$last"')
+        mp3_path = tmp_path / "out.mp3"
+
+        with mp3.Mp3Writer(mp3_path, 24000, 1) as writer:
+            writer.write(PCM)
+            writer.write(PCM)
+
+        assert mp3_path.read_bytes() == PCM * 2
+
+    def test_ffmpeg_failure_reports_stderr_tail(self, tmp_path, monkeypatch):
+        """Test a failing ffmpeg raises with the end of its stderr."""
+        install_fake_ffmpeg(
+            tmp_path, monkeypatch,
+            'cat > /dev/null\nseq 1 5000 >&2\necho "encoder exploded" >&2\nexit 1',
+        )
+
+        with pytest.raises(RuntimeError, match="encoder exploded") as excinfo:
+            convert_pcm_to_mp3(PCM, 24000, 1, tmp_path / "out.mp3")
+
+        # Only the tail of the output is kept
+        assert "\n1\n" not in str(excinfo.value)
+
+
+class TestSplitWavToMp3:
+    """Tests for split_wav_to_mp3 function."""
+
+    def test_one_file_per_section(self, tmp_path):
+        """Test splitting a WAV at the given frames."""
+        pytest.importorskip("lameenc")
+        wav_path = tmp_path / "book.wav"
+        with wave.open(str(wav_path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(24000)
+            wav.writeframes(PCM * 3)
+
+        paths = mp3.split_wav_to_mp3(wav_path, [24000, 48000], tmp_path / "chapters", max_workers=2)
+
+        assert [path.name for path in paths] == ["ch001.mp3", "ch002.mp3", "ch003.mp3"]
+        assert all(path.stat().st_size > 0 for path in paths)
@@ -12,6 +12,7 @@ from tts_generator.parser import (
     parse_json_file,
     parse_file,
     get_unique_speakers,
+    utf8_len,
 )
 
 
@@ -182,6 +183,14 @@ class TestParseJsonFile:
         assert lines[0].speaker == "Alice"
         assert lines[0].text == "Hello!"
 
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test parsing without orjson installed, from str or bytes."""
+        monkeypatch.setattr("tts_generator.parser.orjson", None)
+        content = json.dumps([{"speaker": "Alice", "text": "Héllo!"}])
+
+        assert parse_json_file(content) == parse_json_file(content.encode("utf-8"))
+        assert parse_json_file(content)[0].text == "Héllo!"
+
 
 class TestParseFile:
     """Tests for parse_file function."""
@@ -244,3 +253,25 @@ class TestGetUniqueSpeakers:
         speakers = get_unique_speakers(lines)
 
         assert speakers == ["Narrator"]
+
+
+class TestUtf8Len:
+    """Tests for utf8_len helper."""
+
+    def test_ascii(self):
+        """Test ASCII text length."""
+        assert utf8_len("Hello") == 5
+
+    def test_non_ascii(self):
+        """Test multi-byte characters are counted in bytes."""
+        assert utf8_len("café") == 5
+        assert DialogueLine("Alice", "日本").text_bytes == 6
+
+
+class TestDialogueLine:
+    """Tests for DialogueLine derived fields."""
+
+    def test_word_count(self):
+        """Test word count precomputed on DialogueLine."""
+        assert DialogueLine("Alice", "Hello there, Bob").word_count == 3
+        assert DialogueLine("Alice", "").word_count == 0
@@ -0,0 +1,129 @@
+"""Tests for shared provider helpers."""
+
+import asyncio
+
+import pytest
+
+from tts_generator import providers
+from tts_generator.providers import base
+from tts_generator.providers.base import parse_retry_after, retry_with_backoff
+
+
+class TransientError(Exception):
+    """Error the retry predicate accepts."""
+
+
+class TestRetryWithBackoff:
+    """Tests for retry_with_backoff decorator."""
+
+    @pytest.fixture(autouse=True)
+    def record_sleeps(self, monkeypatch):
+        self.sleeps = []
+        monkeypatch.setattr(base.time, "sleep", self.sleeps.append)
+
+    def test_retries_until_success(self):
+        """Test that failures are retried with doubling delays."""
+        calls = []
+
+        @retry_with_backoff(max_retries=3, base_delay=1.0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise TransientError()
+            return "ok"
+
+        assert flaky() == "ok"
+        assert self.sleeps == [1.0, 2.0]
+
+    def test_should_retry_rejects(self):
+        """Test that errors rejected by should_retry are raised without retrying."""
+        calls = []
+
+        @retry_with_backoff(should_retry=lambda e: isinstance(e, TransientError))
+        def broken():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            broken()
+        assert len(calls) == 1
+        assert self.sleeps == []
+
+    def test_retry_after_overrides_backoff(self):
+        """Test that a server-requested delay is honored, capped at max_delay."""
+        calls = []
+
+        @retry_with_backoff(max_retries=2, max_delay=10.0, retry_after=lambda e: 60.0)
+        def limited():
+            calls.append(1)
+            if len(calls) < 2:
+                raise TransientError()
+            return "ok"
+
+        assert limited() == "ok"
+        assert self.sleeps == [10.0]
+
+
+class TestRetryWithBackoffAsync:
+    """Tests for retry_with_backoff on coroutine functions."""
+
+    def test_retries_until_success(self, monkeypatch):
+        """Test that async failures are retried without blocking the event loop."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(base.time, "sleep", lambda delay: pytest.fail("blocking sleep"))
+        calls = []
+
+        @retry_with_backoff(max_retries=3, base_delay=1.0)
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise TransientError()
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        assert sleeps == [1.0, 2.0]
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        """Test that the last error is raised once retries run out."""
+        async def fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+
+        @retry_with_backoff(max_retries=1)
+        async def broken():
+            raise TransientError()
+
+        with pytest.raises(TransientError):
+            asyncio.run(broken())
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self):
+        """Test that a numeric header is returned in seconds."""
+        assert parse_retry_after({"retry-after": "2.5"}) == 2.5
+
+    def test_missing_or_date(self):
+        """Test that absent headers and HTTP dates are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}) is None
+
+
+class TestLazyProviders:
+    """Tests for the lazily imported provider classes."""
+
+    def test_elevenlabs_exported_and_cached(self):
+        """Test that ElevenLabsProvider is exported and resolved only once."""
+        assert "ElevenLabsProvider" in providers.__all__
+
+        value = providers.ElevenLabsProvider
+
+        assert vars(providers)["ElevenLabsProvider"] is value
@@ -0,0 +1,173 @@
+"""Tests for the splicer module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pydub import AudioSegment as PydubSegment
+
+from tts_generator.parser import DialogueLine
+from tts_generator.providers.base import AudioSegment, TTSProvider
+from tts_generator.splicer import AudioSplicer
+from tts_generator.voices import VoiceManager
+
+
+class FakeProvider(TTSProvider):
+    """Provider returning a constant-valued tone per call."""
+
+    def max_speakers_per_call(self) -> int:
+        return 1
+
+    def max_text_length(self) -> int:
+        return 4000
+
+    def generate_single_speaker(self, text, voice, style_prompt=None):
+        return self._audio(text)
+
+    def generate_multi_speaker(self, dialogue, style_prompt=None):
+        return self._audio(dialogue[0][2])
+
+    def _audio(self, text):
+        return AudioSegment(data=int(text).to_bytes(2, "little") * 2400)
+
+
+class ReverseOrderProvider(FakeProvider):
+    """Provider where each call waits for the next one, so calls finish in reverse."""
+
+    def __init__(self, count: int):
+        self.done = [threading.Event() for _ in range(count)]
+        self.finished = []
+
+    def _audio(self, text):
+        value = int(text)
+        if value + 1 < len(self.done):
+            assert self.done[value + 1].wait(timeout=5)
+        self.finished.append(value)
+        self.done[value].set()
+        return super()._audio(text)
+
+
+class FailingProvider(FakeProvider):
+    """Provider whose first call fails and whose other calls are slow."""
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _audio(self, text):
+        with self.lock:
+            self.calls += 1
+        if text == "0":
+            raise RuntimeError("quota exceeded")
+        time.sleep(0.2)
+        return super()._audio(text)
+
+
+def numbered_lines(count: int) -> list[DialogueLine]:
+    return [DialogueLine(f"Speaker{i}", str(i)) for i in range(count)]
+
+
+class TestGenerateConversation:
+    """Tests for AudioSplicer.generate_conversation."""
+
+    def test_threaded_preserves_segment_order(self):
+        """Test threaded generation splices segments in input order."""
+        lines = numbered_lines(4)
+        provider = ReverseOrderProvider(4)
+        splicer = AudioSplicer(provider, VoiceManager(), pause_ms=0, max_workers=4)
+        progress = []
+
+        audio = splicer.generate_conversation(
+            lines,
+            progress_callback=lambda current, total: progress.append((current, total)),
+        )
+
+        serial = AudioSplicer(FakeProvider(), VoiceManager(), pause_ms=0, max_workers=1)
+
+        assert provider.finished == [3, 2, 1, 0]
+        assert audio.raw_data == serial.generate_conversation(lines).raw_data
+        assert progress == [(i, 4) for i in range(1, 5)]
+
+    def test_failure_cancels_remaining_groups(self):
+        """Test that a failing group stops queued provider calls."""
+        provider = FailingProvider()
+        splicer = AudioSplicer(provider, VoiceManager(), max_workers=2)
+
+        with pytest.raises(RuntimeError):
+            splicer.generate_conversation(numbered_lines(8))
+
+        # The failed call, the one running beside it, and at most one more
+        assert provider.calls <= 3
+
+
+class TestGenerateConversationAsync:
+    """Tests for AudioSplicer.generate_conversation_async."""
+
+    def test_preserves_segment_order(self):
+        """Test segments are spliced in input order despite completion order."""
+        lines = numbered_lines(4)
+        provider = ReverseOrderProvider(4)
+        splicer = AudioSplicer(provider, VoiceManager(), pause_ms=0)
+        progress = []
+
+        audio = asyncio.run(splicer.generate_conversation_async(
+            lines,
+            progress_callback=lambda current, total: progress.append((current, total)),
+            concurrency=4,
+        ))
+        expected = AudioSplicer(FakeProvider(), VoiceManager(), pause_ms=0).generate_conversation(lines)
+
+        assert provider.finished == [3, 2, 1, 0]
+        assert audio.raw_data == expected.raw_data
+        assert progress == [(i, 4) for i in range(1, 5)]
+
+    def test_failure_cancels_remaining_groups(self):
+        """Test that a failing group stops requests still waiting for a slot."""
+        provider = FailingProvider()
+        splicer = AudioSplicer(provider, VoiceManager())
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(splicer.generate_conversation_async(numbered_lines(8), concurrency=2))
+
+        assert provider.calls <= 3
+
+
+class TestSpliceSegments:
+    """Tests for AudioSplicer._splice_segments."""
+
+    def test_matches_repeated_append(self):
+        """Test that splicing matches crossfading each segment onto the whole result."""
+        segments = [
+            PydubSegment(
+                data=bytes(range(i, i + 200)) * (frames // 100),
+                sample_width=2,
+                frame_rate=24000,
+                channels=1,
+            )
+            for i, frames in enumerate([2400, 24, 4800, 120, 2400])
+        ]
+        splicer = AudioSplicer(FakeProvider(), VoiceManager(), pause_ms=3)
+
+        silence = PydubSegment.silent(duration=3, frame_rate=24000)
+        expected = segments[0]
+        for segment in segments[1:]:
+            with_pause = silence + segment
+            fade = min(25, len(expected), len(with_pause))
+            expected = expected.append(with_pause, crossfade=fade) if fade >= 5 else expected + with_pause
+
+        assert splicer._splice_segments(segments).raw_data == expected.raw_data
+
+
+class TestExportPcm:
+    """Tests for AudioSplicer.export_pcm."""
+
+    def test_returns_raw_pcm_and_format(self):
+        """Test exporting audio as PCM without touching disk."""
+        splicer = AudioSplicer(FakeProvider(), VoiceManager(), pause_ms=0)
+        audio = splicer.generate_conversation([DialogueLine("Alice", "3")])
+
+        pcm, sample_rate, channels = splicer.export_pcm(audio)
+
+        assert pcm == audio.raw_data
+        assert (sample_rate, channels) == (24000, 1)
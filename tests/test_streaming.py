@@ -0,0 +1,212 @@
+"""Tests for the streaming module."""
+
+import time
+import wave
+from array import array
+
+import pytest
+from pydub import AudioSegment as PydubSegment
+
+from tts_generator import streaming
+from tts_generator.chunker import Chunk
+from tts_generator.parser import DialogueLine
+from tts_generator.providers.base import AudioSegment
+from tts_generator.streaming import StreamingGenerator, crossfade_segments
+from tts_generator.voices import VoiceManager
+
+
+def make_generator(tmp_path) -> StreamingGenerator:
+    """Create a generator whose provider is never called."""
+    return StreamingGenerator(provider=None, voice_manager=VoiceManager(), output_path=tmp_path / "out.wav")
+
+
+class RampProvider:
+    """Provider returning a distinct sample ramp per chunk, optionally failing once."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+
+    def generate_single_speaker(self, text, voice, style_prompt=None):
+        if text == self.fail_on:
+            self.fail_on = None
+            raise RuntimeError("transient failure")
+        n = int(text)
+        samples = range(n * 100, n * 100 + 1000 + n * 37)
+        return AudioSegment(data=b"".join(v.to_bytes(2, "little") for v in samples))
+
+
+class SlowFirstProvider(RampProvider):
+    """Provider whose earlier chunks take longer, so they finish out of order."""
+
+    def generate_single_speaker(self, text, voice, style_prompt=None):
+        time.sleep(0.01 * (6 - int(text)))
+        return super().generate_single_speaker(text, voice, style_prompt)
+
+
+def make_chunks(count: int) -> list[Chunk]:
+    return [
+        Chunk(i, [DialogueLine("A", str(i))], is_chapter_start=(i % 3 == 0))
+        for i in range(count)
+    ]
+
+
+def read_pcm(path) -> bytes:
+    with wave.open(str(path), "rb") as wav:
+        return wav.readframes(wav.getnframes())
+
+
+def constant(value: int, frames: int) -> PydubSegment:
+    return PydubSegment(
+        data=array("h", [value] * frames).tobytes(),
+        sample_width=2,
+        frame_rate=24000,
+        channels=1,
+    )
+
+
+class TestCrossfadeSegments:
+    """Tests for crossfade_segments."""
+
+    def test_overlaps_and_keeps_ends(self):
+        """Test that only the overlap is blended and the rest is copied."""
+        result = crossfade_segments(constant(1000, 2400), constant(-1000, 2400), crossfade_ms=25)
+        samples = array("h", result.raw_data)
+
+        assert len(samples) == 2400 + 2400 - 600
+        assert samples[:1800] == array("h", [1000] * 1800)
+        assert samples[2400:] == array("h", [-1000] * 1800)
+
+    def test_equal_power(self):
+        """Test that a fade into silence follows a cosine curve."""
+        result = crossfade_segments(constant(10000, 2400), constant(0, 2400), crossfade_ms=25)
+        samples = array("h", result.raw_data)
+
+        # Half-way through the fade the gain is cos(pi/4)
+        assert abs(samples[1800 + 300] - 7071) < 30
+        assert samples[2399] < 50
+
+    def test_too_short_concatenates(self):
+        """Test that segments under 5ms are joined without a crossfade."""
+        result = crossfade_segments(constant(1, 48), constant(2, 2400))
+
+        assert len(result.raw_data) == (48 + 2400) * 2
+
+
+class TestAppendAudio:
+    """Tests for StreamingGenerator's incremental WAV output."""
+
+    def test_callback_matches_file(self, tmp_path):
+        """Test that the audio callback receives exactly the file's PCM."""
+        emitted = []
+        generator = StreamingGenerator(RampProvider(), VoiceManager(), tmp_path / "out.wav")
+
+        generator.generate(make_chunks(6), audio_callback=emitted.append)
+
+        assert b"".join(emitted) == read_pcm(tmp_path / "out.wav")
+        assert len(generator.chapter_starts) == 1
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        """Test that resuming after a failure produces the same audio."""
+        chunks = make_chunks(6)
+        StreamingGenerator(RampProvider(), VoiceManager(), tmp_path / "full.wav").generate(chunks)
+
+        provider = RampProvider(fail_on="4")
+        output = tmp_path / "resumed.wav"
+        with pytest.raises(RuntimeError):
+            StreamingGenerator(provider, VoiceManager(), output, state_save_interval=1).generate(chunks)
+        emitted = []
+        StreamingGenerator(provider, VoiceManager(), output).generate(
+            chunks, resume=True, audio_callback=emitted.append
+        )
+
+        assert read_pcm(output) == read_pcm(tmp_path / "full.wav")
+        assert b"".join(emitted) == read_pcm(output)
+
+    def test_concurrent_chunks_written_in_order(self, tmp_path):
+        """Test that chunks finishing out of order are still appended in order."""
+        chunks = make_chunks(6)
+        serial = StreamingGenerator(RampProvider(), VoiceManager(), tmp_path / "serial.wav", max_workers=1)
+        serial.generate(chunks)
+
+        progress = []
+        StreamingGenerator(SlowFirstProvider(), VoiceManager(), tmp_path / "parallel.wav").generate(
+            chunks, progress_callback=lambda current, total, stats: progress.append(current)
+        )
+
+        assert read_pcm(tmp_path / "parallel.wav") == read_pcm(tmp_path / "serial.wav")
+        assert progress == [1, 2, 3, 4, 5, 6]
+
+
+class TestStateJournal:
+    """Tests for StreamingGenerator state saving and loading."""
+
+    def test_latest_record_wins(self, tmp_path):
+        """Test that loading returns the most recent saved state."""
+        generator = make_generator(tmp_path)
+        for completed in (5, 10, 15):
+            generator._save_state(completed, 20)
+
+        assert len(generator.state_path.read_text().splitlines()) == 3
+        assert make_generator(tmp_path)._load_state()["completed_chunks"] == 15
+
+    def test_torn_record_ignored(self, tmp_path):
+        """Test that a partially written final record is skipped."""
+        generator = make_generator(tmp_path)
+        generator._save_state(5, 20)
+        with open(generator.state_path, "a") as f:
+            f.write('{"completed_chunks": 1')
+
+        assert generator._load_state()["completed_chunks"] == 5
+
+    def test_torn_utf8_record_ignored(self, tmp_path):
+        """Test that a record cut off inside a multi-byte character is skipped."""
+        generator = make_generator(tmp_path)
+        generator.voice_manager.assign_voice("José")
+        generator._save_state(5, 20)
+        with open(generator.state_path, "ab") as f:
+            f.write('{"voice_assignments":{"café'.encode()[:-1])
+
+        state = generator._load_state()
+        assert state["completed_chunks"] == 5
+        assert "José" in state["voice_assignments"]
+
+    def test_invariant_fields_written_once(self, tmp_path):
+        """Test that later records omit unchanged fields but load in full."""
+        generator = make_generator(tmp_path)
+        generator.voice_manager.assign_voice("Alice")
+        for completed in (5, 10):
+            generator._save_state(completed, 20)
+
+        records = generator.state_path.read_text().splitlines()
+        assert "voice_assignments" in records[0]
+        assert "voice_assignments" not in records[1]
+        state = make_generator(tmp_path)._load_state()
+        assert state["completed_chunks"] == 10
+        assert state["total_chunks"] == 20
+        assert "Alice" in state["voice_assignments"]
+
+    def test_changed_assignments_rewritten(self, tmp_path):
+        """Test that assignments made mid-run are written with the next record."""
+        generator = make_generator(tmp_path)
+        generator.voice_manager.assign_voice("Alice")
+        generator._save_state(5, 20)
+        generator._save_state(10, 20)
+        generator.voice_manager.assign_voice("Bob")
+        generator._save_state(15, 20)
+
+        records = generator.state_path.read_text().splitlines()
+        assert "voice_assignments" not in records[1]
+        assert "Bob" in records[2]
+        assert "Bob" in make_generator(tmp_path)._load_state()["voice_assignments"]
+
+    def test_compaction(self, tmp_path, monkeypatch):
+        """Test that the journal is compacted to its latest record."""
+        monkeypatch.setattr(streaming, "STATE_COMPACT_RECORDS", 3)
+        generator = make_generator(tmp_path)
+        for completed in range(1, 5):
+            generator._save_state(completed, 20)
+
+        assert len(generator.state_path.read_text().splitlines()) == 1
+        state = generator._load_state()
+        assert state["completed_chunks"] == 4
+        assert state["total_chunks"] == 20
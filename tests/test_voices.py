@@ -6,6 +6,7 @@ from tts_generator.voices import (
     VoiceInfo,
     VoiceManager,
     GOOGLE_VOICES,
+    SORTED_GOOGLE_VOICES,
     DEFAULT_VOICE_ASSIGNMENTS,
     AUTO_ASSIGN_VOICES,
     list_voices,
@@ -51,6 +52,11 @@ class TestGoogleVoices:
             assert info.characteristic
             assert info.gender in ("male", "female", None)
 
+    def test_sorted_voices(self):
+        """Test that the sorted listing covers every voice in name order."""
+        names = [info.name for info in SORTED_GOOGLE_VOICES]
+        assert names == sorted(GOOGLE_VOICES)
+
 
 class TestVoiceManager:
     """Tests for VoiceManager class."""
@@ -132,6 +138,33 @@ class TestVoiceManager:
         # Should have assigned all speakers (some voices reused)
         assert len(voices) == len(GOOGLE_VOICES) + 5
 
+    def test_bulk_matches_individual_assignment(self):
+        """Test that bulk assignment matches assigning one by one."""
+        speakers = ["Provider", "Alice", "Patient", "Alice"] + [
+            f"Speaker{i}" for i in range(len(GOOGLE_VOICES) + 3)
+        ]
+        bulk = VoiceManager()
+        bulk.set_manual_assignments({"Bob": "Kore"})
+        single = VoiceManager()
+        single.set_manual_assignments({"Bob": "Kore"})
+
+        bulk.assign_voices_bulk(speakers)
+        for speaker in speakers:
+            single.assign_voice(speaker)
+
+        assert bulk.get_all_assignments() == single.get_all_assignments()
+
+    def test_auto_assignment_skips_manually_taken_voices(self):
+        """Test that voices taken manually between auto-assignments are skipped."""
+        manager = VoiceManager()
+
+        first = manager.assign_voice("Alice")
+        manager.set_manual_assignments({"Bob": AUTO_ASSIGN_VOICES[1]})
+        second = manager.assign_voice("Carol")
+
+        assert first == AUTO_ASSIGN_VOICES[0]
+        assert second == AUTO_ASSIGN_VOICES[2]
+
     def test_same_speaker_same_voice(self):
         """Test that the same speaker always gets the same voice."""
         manager = VoiceManager()
@@ -0,0 +1,76 @@
+"""Request batching for dialogue lines."""
+
+from __future__ import annotations
+
+from .chunker import MAX_CHAPTER_MARKER_LENGTH, is_chapter_marker
+from .parser import DialogueLine
+
+# Keep fused lines well under the 4KB per-request API limit
+DEFAULT_MAX_FUSED_BYTES = 3000
+
+
+def fuse_adjacent(
+    lines: list[DialogueLine],
+    max_bytes: int = DEFAULT_MAX_FUSED_BYTES,
+) -> list[DialogueLine]:
+    """Merge consecutive lines from the same speaker into one line.
+
+    Fewer, longer turns mean fewer speaker labels and turn boundaries in
+    each request, and fewer lines for the chunker to place. Text is joined
+    with a space, as single-speaker groups already are. Chapter markers
+    are never merged, so chapter detection still sees them on their own,
+    and lines are never merged into text that would itself read as a
+    chapter marker (e.g. "Chapter" followed by "3 was the best.").
+
+    Args:
+        lines: Parsed dialogue lines
+        max_bytes: Maximum UTF-8 size of a fused line's text
+
+    Returns:
+        New list of dialogue lines (the input is not modified)
+    """
+    fused: list[DialogueLine] = []
+    # Texts, byte size and length of the run being built for fused[-1]
+    run_texts: list[str] = []
+    run_bytes = 0
+    run_chars = 0
+    run_open = False
+
+    def close_run():
+        if len(run_texts) > 1:
+            fused[-1] = DialogueLine(fused[-1].speaker, " ".join(run_texts))
+
+    for line in lines:
+        is_chapter = (
+            len(line.text) <= MAX_CHAPTER_MARKER_LENGTH and is_chapter_marker(line.text)[0]
+        )
+
+        if (
+            run_open
+            and not is_chapter
+            and line.speaker == fused[-1].speaker
+            and run_bytes + 1 + line.text_bytes <= max_bytes
+            and not _forms_chapter_marker(run_texts, run_chars, line.text)
+        ):
+            run_texts.append(line.text)
+            run_bytes += 1 + line.text_bytes
+            run_chars += 1 + len(line.text)
+            continue
+
+        close_run()
+        fused.append(line)
+        run_texts = [line.text]
+        run_bytes = line.text_bytes
+        run_chars = len(line.text)
+        # A chapter marker stays alone; nothing is appended to it
+        run_open = not is_chapter
+
+    close_run()
+    return fused
+
+
+def _forms_chapter_marker(run_texts: list[str], run_chars: int, text: str) -> bool:
+    """Check whether appending text to a run would make it a chapter marker."""
+    if run_chars + 1 + len(text) > MAX_CHAPTER_MARKER_LENGTH:
+        return False
+    return is_chapter_marker(" ".join([*run_texts, text]))[0]
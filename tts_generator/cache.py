@@ -0,0 +1,233 @@
+"""On-disk cache of generated audio segments."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import wave
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from .providers.base import AudioSegment, TTSProvider
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tts-generator"
+
+# Default cap on the total size of cache entries
+DEFAULT_MAX_CACHE_BYTES = 1 << 30  # 1 GiB
+
+# Eviction frees space down to this fraction of the cap, so it runs rarely
+_EVICT_TO = 0.9
+
+# Separators that cannot appear in ordinary dialogue text
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+
+
+class SegmentCache:
+    """Stores provider output keyed by a hash of everything sent to the provider.
+
+    Repeated lines, and whole re-runs of the same input, are then served
+    from disk instead of making another TTS call. Entries are WAV files
+    under <cache_dir>/<hash[:2]>/<hash>.wav. Once they total more than
+    max_bytes, the least recently used entries (by mtime, which a hit
+    refreshes) are deleted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int | None = DEFAULT_MAX_CACHE_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: ~/.cache/tts-generator)
+            max_bytes: Size cap for all entries (default: 1 GiB), or None for no cap
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Total entry size, scanned on the first put and tracked from then on
+        self._size: int | None = None
+        self._size_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        provider: TTSProvider,
+        dialogue: list[tuple[str, str, str]],
+        style_prompt: str | None = None,
+    ) -> str:
+        """Build the cache key for one provider call.
+
+        Args:
+            provider: Provider that would generate the audio
+            dialogue: List of (speaker_name, voice_name, text) tuples for the call
+            style_prompt: Optional style direction for TTS
+
+        Returns:
+            Hex digest identifying the audio
+        """
+        provider_id = f"{type(provider).__name__}:{getattr(provider, 'MODEL', '')}"
+        records = [provider_id, style_prompt or ""]
+        records.extend(_FIELD_SEP.join(entry) for entry in dialogue)
+        data = _RECORD_SEP.join(records).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.wav"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry, skipping ones that vanish."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.wav"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def get(self, key: str) -> AudioSegment | None:
+        """Return the cached audio for key, or None if not cached or unreadable."""
+        path = self._path(key)
+        try:
+            with wave.open(str(path), "rb") as wav:
+                audio = AudioSegment(
+                    data=wav.readframes(wav.getnframes()),
+                    sample_rate=wav.getframerate(),
+                    channels=wav.getnchannels(),
+                    sample_width=wav.getsampwidth(),
+                )
+        except (OSError, EOFError, wave.Error):
+            return None
+
+        try:
+            # Mark the entry as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return audio
+
+    def put(self, key: str, audio: AudioSegment):
+        """Store audio under key.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent runs never see a partial entry.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as wav:
+                wav.setnchannels(audio.channels)
+                wav.setsampwidth(audio.sample_width)
+                wav.setframerate(audio.sample_rate)
+                wav.writeframes(audio.data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        if self.max_bytes is not None:
+            self._track(path.stat().st_size)
+
+    def _track(self, added: int):
+        """Count a newly stored entry, evicting old entries when over the cap."""
+        with self._size_lock:
+            if self._size is None:
+                # The scan already includes the new entry
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += added
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until well under the cap."""
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICT_TO
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+    def clear(self) -> int:
+        """Delete every entry.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        with self._size_lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                deleted += 1
+            self._size = None
+        return deleted
+
+    def get_or_compute(self, key: str, compute: Callable[[], AudioSegment]) -> AudioSegment:
+        """Return the cached audio for key, generating and storing it on a miss.
+
+        Args:
+            key: Cache key from make_key
+            compute: Callable producing the audio when it is not cached
+
+        Returns:
+            The cached or newly generated audio
+        """
+        audio = self.get(key)
+        if audio is not None:
+            self.hits += 1
+            return audio
+
+        self.misses += 1
+        audio = compute()
+        try:
+            self.put(key, audio)
+        except OSError:
+            # A read-only or full cache should never fail generation
+            pass
+        return audio
+
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[AudioSegment]],
+    ) -> AudioSegment:
+        """Async version of get_or_compute; disk access runs in a worker thread.
+
+        Args:
+            key: Cache key from make_key
+            compute: Coroutine function producing the audio when it is not cached
+
+        Returns:
+            The cached or newly generated audio
+        """
+        audio = await asyncio.to_thread(self.get, key)
+        if audio is not None:
+            self.hits += 1
+            return audio
+
+        self.misses += 1
+        audio = await compute()
+        try:
+            await asyncio.to_thread(self.put, key, audio)
+        except OSError:
+            # A read-only or full cache should never fail generation
+            pass
+        return audio
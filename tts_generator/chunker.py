@@ -3,47 +3,71 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 
-from .parser import DialogueLine, get_unique_speakers
+from .parser import DialogueLine, get_unique_speakers, utf8_len
 
+_text_bytes = attrgetter('text_bytes')
+_word_count = attrgetter('word_count')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Chunk:
     """A chunk of dialogue for generation."""
     index: int
     lines: list[DialogueLine]
-    speakers: list[str] = field(default_factory=list)
+    speakers: list[str] | tuple[str, ...] = ()
     is_chapter_start: bool = False
     chapter_title: str | None = None
 
     @property
     def text_size(self) -> int:
         """Get approximate byte size of text content."""
-        return sum(len(line.text.encode('utf-8')) for line in self.lines)
+        return sum(map(_text_bytes, self.lines))
 
     def to_text(self) -> str:
         """Convert chunk to text format."""
         return "\n".join(f"{line.speaker}: {line.text}" for line in self.lines)
 
 
-# Chapter detection patterns
-CHAPTER_PATTERNS = [
-    re.compile(r'^(chapter|part|section)\s+(\d+|[ivxlcdm]+)', re.IGNORECASE),
-    re.compile(r'^(chapter|part|section)\s+\w+:', re.IGNORECASE),
-    re.compile(r'^#{1,3}\s+'),  # Markdown headers
-    re.compile(r'^[*\-=]{3,}$'),  # Dividers
-]
+# Chapter detection pattern: one alternation so each line costs a single match
+_CHAPTER_RE = re.compile(
+    r'^(?:'
+    r'(?:chapter|part|section)\s+(?:\d+|[ivxlcdm]+|\w+:)'  # Chapter 1, Part IV, Section One:
+    r'|#{1,3}\s+'  # Markdown headers
+    r'|[*\-=]{3,}$'  # Dividers
+    r')',
+    re.IGNORECASE,
+)
+
+# Kept for callers that iterate the patterns
+CHAPTER_PATTERNS = [_CHAPTER_RE]
+
+# Every chapter marker starts with one of these characters (\u017f, long s,
+# case-folds to "s")
+_CHAPTER_FIRST_CHARS = frozenset('cCpPsS\u017f#*-=')
+
+# Lines longer than this are dialogue, not headings, and skip chapter detection
+MAX_CHAPTER_MARKER_LENGTH = 80
 
 
 def is_chapter_marker(text: str) -> tuple[bool, str | None]:
     """Check if text is a chapter marker and extract title."""
     text = text.strip()
+    # Cheap rejection for ordinary dialogue before touching the regex
+    if not text or text[0] not in _CHAPTER_FIRST_CHARS:
+        return False, None
+    return _match_chapter(text)
 
-    for pattern in CHAPTER_PATTERNS:
-        if pattern.match(text):
-            return True, text
 
+@lru_cache(maxsize=8192)
+def _match_chapter(text: str) -> tuple[bool, str | None]:
+    """Match stripped text against the chapter pattern (memoized)."""
+    if _CHAPTER_RE.match(text):
+        return True, text
     return False, None
 
 
@@ -70,78 +94,95 @@ class TextChunker:
     def chunk(self, lines: list[DialogueLine]) -> list[Chunk]:
         """Split dialogue lines into chunks.
 
+        See chunk_iter for the splitting strategy.
+        """
+        return list(self.chunk_iter(lines))
+
+    def chunk_iter(self, lines: list[DialogueLine]) -> Iterator[Chunk]:
+        """Split dialogue lines into chunks, yielding each as it closes.
+
         Strategy:
         1. Group by speaker pairs (max 2 per chunk for Google API)
         2. Split when text size exceeds max_bytes
         3. Start new chunk at chapter markers
         4. Preserve natural conversation flow
         """
+        for index, (start, end, speakers, is_chapter_start, chapter_title) in enumerate(
+            self._iter_boundaries(lines)
+        ):
+            yield Chunk(
+                index=index,
+                lines=lines[start:end],
+                speakers=speakers,
+                is_chapter_start=is_chapter_start,
+                chapter_title=chapter_title,
+            )
+
+    def _iter_boundaries(
+        self, lines: list[DialogueLine]
+    ) -> Iterator[tuple[int, int, list[str], bool, str | None]]:
+        """Yield (start, end, speakers, is_chapter_start, chapter_title) per chunk.
+
+        Chunks are contiguous runs of lines, so only the boundary indices are
+        tracked here; chunk_iter slices the lines once per chunk.
+        """
         if not lines:
-            return []
+            return
 
-        chunks = []
-        current_lines = []
-        current_speakers = set()
+        start = 0
+        # At most max_speakers (2 for Google) entries, so a list scan beats hashing
+        current_speakers: list[str] = []
         current_size = 0
-        chunk_index = 0
         # Track chapter info for current chunk
         current_is_chapter_start = False
         current_chapter_title = None
+        # Speakers repeat on every line, so measure each name only once
+        speaker_bytes: dict[str, int] = {}
 
-        for line in lines:
-            line_size = len(line.text.encode('utf-8')) + len(line.speaker.encode('utf-8')) + 2
+        for i, line in enumerate(lines):
+            speaker_size = speaker_bytes.get(line.speaker)
+            if speaker_size is None:
+                speaker_size = speaker_bytes[line.speaker] = utf8_len(line.speaker)
+            line_size = line.text_bytes + speaker_size + 2
 
             # Check for chapter marker
-            is_chapter, chapter_title = is_chapter_marker(line.text)
+            if len(line.text) <= MAX_CHAPTER_MARKER_LENGTH:
+                is_chapter, chapter_title = is_chapter_marker(line.text)
+            else:
+                is_chapter, chapter_title = False, None
 
             # Decide if we need to start a new chunk
             needs_new_chunk = False
 
-            if is_chapter and current_lines:
+            if is_chapter and i > start:
                 needs_new_chunk = True
             elif line.speaker not in current_speakers and len(current_speakers) >= self.max_speakers:
                 needs_new_chunk = True
-            elif current_size + line_size > self.max_bytes and current_lines:
+            elif current_size + line_size > self.max_bytes and i > start:
                 needs_new_chunk = True
 
-            # Save current chunk if needed
+            # Close current chunk if needed
             if needs_new_chunk:
-                chunks.append(Chunk(
-                    index=chunk_index,
-                    lines=current_lines,
-                    speakers=list(current_speakers),
-                    is_chapter_start=current_is_chapter_start,
-                    chapter_title=current_chapter_title,
-                ))
-                chunk_index += 1
-                current_lines = []
-                current_speakers = set()
+                yield start, i, current_speakers, current_is_chapter_start, current_chapter_title
+                start = i
+                current_speakers = []
                 current_size = 0
                 # Reset chapter tracking for new chunk
                 current_is_chapter_start = False
                 current_chapter_title = None
 
             # Add line to current chunk
-            current_lines.append(line)
-            current_speakers.add(line.speaker)
+            if line.speaker not in current_speakers:
+                current_speakers.append(line.speaker)
             current_size += line_size
 
             # Mark chapter start if this is first line of chunk and is a chapter marker
-            if is_chapter and len(current_lines) == 1:
+            if is_chapter and i == start:
                 current_is_chapter_start = True
                 current_chapter_title = chapter_title
 
         # Don't forget the last chunk
-        if current_lines:
-            chunks.append(Chunk(
-                index=chunk_index,
-                lines=current_lines,
-                speakers=list(current_speakers),
-                is_chapter_start=current_is_chapter_start,
-                chapter_title=current_chapter_title,
-            ))
-
-        return chunks
+        yield start, len(lines), current_speakers, current_is_chapter_start, current_chapter_title
 
     def estimate_duration(self, chunks: list[Chunk], words_per_minute: int = 150) -> float:
         """Estimate total audio duration in seconds.
@@ -155,12 +196,11 @@ class TextChunker:
         """
         total_words = 0
         for chunk in chunks:
-            for line in chunk.lines:
-                total_words += len(line.text.split())
+            total_words += sum(map(_word_count, chunk.lines))
 
         return (total_words / words_per_minute) * 60
 
-    def get_stats(self, chunks: list[Chunk]) -> dict:
+    def get_stats(self, chunks: list[Chunk], words_per_minute: int = 150) -> dict:
         """Get statistics about the chunks."""
         if not chunks:
             return {"chunks": 0, "lines": 0, "speakers": 0, "estimated_duration": 0}
@@ -168,11 +208,17 @@ class TextChunker:
         all_speakers = set()
         total_lines = 0
         total_bytes = 0
+        total_words = 0
 
+        # Single traversal: accumulate everything estimate_duration would need too
         for chunk in chunks:
             total_lines += len(chunk.lines)
-            total_bytes += chunk.text_size
             all_speakers.update(chunk.speakers)
+            for line in chunk.lines:
+                total_bytes += line.text_bytes
+                total_words += line.word_count
+
+        duration_sec = (total_words / words_per_minute) * 60
 
         return {
             "chunks": len(chunks),
@@ -180,6 +226,6 @@ class TextChunker:
             "speakers": len(all_speakers),
             "speaker_names": sorted(all_speakers),
             "total_bytes": total_bytes,
-            "estimated_duration_sec": self.estimate_duration(chunks),
-            "estimated_duration_min": self.estimate_duration(chunks) / 60,
+            "estimated_duration_sec": duration_sec,
+            "estimated_duration_min": duration_sec / 60,
         }
@@ -3,36 +3,47 @@
 from __future__ import annotations
 
 import argparse
-import shutil
-import subprocess
+import asyncio
+import codecs
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
+from .batching import fuse_adjacent
+from .cache import DEFAULT_MAX_CACHE_BYTES, SegmentCache
+from .mp3 import (
+    Mp3Writer,
+    convert_pcm_to_mp3,
+    convert_to_mp3,
+    has_streaming_encoder,
+    split_wav_to_mp3,
+)
 from .parser import parse_file, get_unique_speakers
-from .providers import GoogleTTSProvider
-from .splicer import AudioSplicer
-from .voices import VoiceManager, GOOGLE_VOICES
+from .splicer import DEFAULT_CONCURRENCY, AudioSplicer, group_dialogue_by_speaker_pairs
+from .voices import VoiceManager, SORTED_GOOGLE_VOICES
 
 
 console = Console()
 
+# Bytes read up front to check the input file is readable UTF-8
+INPUT_PROBE_BYTES = 65536
+
+
+# One "speaker:voice" entry of a comma-separated mapping, whitespace trimmed
+_MAPPING_RE = re.compile(r'\s*([^:,]+?)\s*:\s*([^,]+?)\s*(?:,|$)')
+
 
 def parse_voice_mapping(voice_str: str) -> dict[str, str]:
     """Parse voice mapping string like 'Speaker A:Kore,Provider:Charon'."""
     if not voice_str:
         return {}
 
-    mapping = {}
-    pairs = voice_str.split(',')
-    for pair in pairs:
-        if ':' in pair:
-            speaker, voice = pair.split(':', 1)
-            mapping[speaker.strip()] = voice.strip()
-    return mapping
+    return dict(_MAPPING_RE.findall(voice_str))
 
 
 def list_available_voices():
@@ -42,8 +53,8 @@ def list_available_voices():
     table.add_column("Characteristic", style="green")
     table.add_column("Gender", style="magenta")
 
-    for name, info in sorted(GOOGLE_VOICES.items()):
-        table.add_row(name, info.characteristic, info.gender or "")
+    for info in SORTED_GOOGLE_VOICES:
+        table.add_row(info.name, info.characteristic, info.gender or "")
 
     console.print(table)
 
@@ -57,7 +68,7 @@ def confirm_overwrite(path: Path) -> bool:
 
 def estimate_duration(lines: list, words_per_minute: int = 150) -> float:
     """Estimate audio duration in seconds from dialogue lines."""
-    total_words = sum(len(line.text.split()) for line in lines)
+    total_words = sum(line.word_count for line in lines)
     return (total_words / words_per_minute) * 60
 
 
@@ -93,50 +104,11 @@ def detect_output_format(output_path: str, explicit_format: str | None) -> str:
     return 'wav'
 
 
-def convert_to_mp3(wav_path: Path, mp3_path: Path, delete_wav: bool = True) -> Path:
-    """Convert WAV file to MP3 using ffmpeg.
-
-    Args:
-        wav_path: Path to input WAV file
-        mp3_path: Path for output MP3 file
-        delete_wav: Whether to delete the intermediate WAV file
-
-    Returns:
-        Path to the MP3 file
-
-    Raises:
-        RuntimeError: If ffmpeg is not installed or conversion fails
-    """
-    # Check if ffmpeg is available
-    if not shutil.which('ffmpeg'):
-        raise RuntimeError(
-            "MP3 output requires ffmpeg. Install with: brew install ffmpeg"
-        )
-
-    # Run ffmpeg conversion
-    cmd = [
-        'ffmpeg', '-y',  # Overwrite output
-        '-i', str(wav_path),
-        '-codec:a', 'libmp3lame',
-        '-qscale:a', '2',  # High quality VBR
-        str(mp3_path)
-    ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"ffmpeg conversion failed: {e.stderr}")
-
-    # Delete intermediate WAV if requested
-    if delete_wav and wav_path.exists():
-        wav_path.unlink()
-
-    return mp3_path
+def create_cache(args) -> SegmentCache | None:
+    """Create the segment cache unless disabled with --no-cache."""
+    if args.no_cache:
+        return None
+    return SegmentCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024)
 
 
 def run_standard_mode(args, lines, speakers, voice_manager, provider, output_format: str):
@@ -145,6 +117,7 @@ def run_standard_mode(args, lines, speakers, voice_manager, provider, output_for
         provider=provider,
         voice_manager=voice_manager,
         pause_ms=args.pause,
+        cache=create_cache(args),
     )
 
     with Progress(
@@ -155,24 +128,23 @@ def run_standard_mode(args, lines, speakers, voice_manager, provider, output_for
         task = progress.add_task("Generating audio...", total=None)
 
         def update_progress(current, total):
-            progress.update(task, description=f"Generating segment {current}/{total}...")
+            progress.update(task, description=f"Generated segment {current}/{total}...")
 
-        audio = splicer.generate_conversation(
-            lines,
+        audio = asyncio.run(splicer.generate_conversation_async(
+            fuse_adjacent(lines),
             style_prompt=args.style,
             progress_callback=update_progress,
-        )
+            concurrency=args.concurrency,
+        ))
 
     # Determine output paths
     final_output_path = Path(args.output)
 
     if output_format == 'mp3':
-        # Generate to WAV first, then convert
-        wav_path = final_output_path.with_suffix('.wav')
-        splicer.export(audio, wav_path)
-
+        # Encode the in-memory PCM directly, no intermediate WAV
         console.print("[cyan]Converting to MP3...[/cyan]")
-        convert_to_mp3(wav_path, final_output_path, delete_wav=True)
+        pcm, sample_rate, channels = splicer.export_pcm(audio)
+        convert_pcm_to_mp3(pcm, sample_rate, channels, final_output_path)
     else:
         splicer.export(audio, final_output_path)
 
@@ -180,52 +152,53 @@ def run_standard_mode(args, lines, speakers, voice_manager, provider, output_for
     console.print(f"[dim]Duration:[/dim] {len(audio) / 1000:.1f} seconds")
 
 
+def run_dry_run(args, lines, speakers, voice_manager):
+    """Report what a run would generate without calling the TTS provider."""
+    # Mirror the request layout of the selected mode
+    fused = fuse_adjacent(lines)
+    if args.audiobook:
+        from .chunker import TextChunker
+
+        chunker = TextChunker(chapter_pause_ms=args.chapter_pause)
+        stats = chunker.get_stats(chunker.chunk(fused))
+        requests = stats["chunks"]
+        duration_sec = stats["estimated_duration_sec"]
+    else:
+        requests = len(group_dialogue_by_speaker_pairs(fused, max_speakers=2))
+        duration_sec = estimate_duration(lines)
+
+    line_counts = Counter(line.speaker for line in lines)
+    assignments = voice_manager.get_all_assignments()
+
+    table = Table(title="Dry Run")
+    table.add_column("Speaker", style="cyan")
+    table.add_column("Voice", style="green")
+    table.add_column("Lines", justify="right")
+    for speaker in speakers:
+        table.add_row(speaker, assignments.get(speaker, ""), str(line_counts[speaker]))
+    console.print(table)
+
+    console.print(f"[dim]Mode:[/dim] {'audiobook' if args.audiobook else 'standard'}")
+    console.print(f"[dim]API requests:[/dim] {requests}")
+    console.print(f"[dim]Text size:[/dim] {sum(line.text_bytes for line in lines):,} bytes")
+    console.print(f"[dim]Estimated duration:[/dim] {format_duration(duration_sec)}")
+    console.print("[yellow]Dry run:[/yellow] no audio generated.")
+
+
 def run_audiobook_mode(args, lines, speakers, voice_manager, provider, output_format: str):
     """Run audiobook mode with chunking and streaming."""
     from .chunker import TextChunker
-    from .streaming import StreamingGenerator
+    from .streaming import TARGET_CHANNELS, TARGET_SAMPLE_RATE, StreamingGenerator
 
     final_output_path = Path(args.output)
 
-    # For MP3 output, we generate to WAV first then convert
+    # For MP3 output, the WAV is still written so interrupted runs can resume
     if output_format == 'mp3':
         wav_output_path = final_output_path.with_suffix('.wav')
     else:
         wav_output_path = final_output_path
 
-    # Chunk the text
-    console.print("[cyan]Chunking text for audiobook mode...[/cyan]")
-    chunker = TextChunker(
-        max_bytes=3500,
-        max_speakers_per_chunk=2,
-        chapter_pause_ms=args.chapter_pause,
-    )
-    chunks = chunker.chunk(lines)
-    stats = chunker.get_stats(chunks)
-
-    console.print(f"[green]Created:[/green] {stats['chunks']} chunks")
-    console.print(f"[dim]Estimated duration:[/dim] {stats['estimated_duration_min']:.1f} minutes")
-
-    # Check for resume
-    state_path = wav_output_path.with_suffix('.state.json')
-    if args.resume and state_path.exists():
-        console.print("[yellow]Resuming from previous state...[/yellow]")
-    elif state_path.exists() and not args.resume:
-        console.print("[yellow]Warning:[/yellow] State file found. Use --resume to continue, or delete it to start fresh.")
-        if wav_output_path.exists():
-            wav_output_path.unlink()
-        state_path.unlink()
-
-    # Create streaming generator
-    generator = StreamingGenerator(
-        provider=provider,
-        voice_manager=voice_manager,
-        output_path=wav_output_path,
-        pause_ms=args.pause,
-        chapter_pause_ms=args.chapter_pause,
-    )
-
-    # Generate with progress
+    # One live display for every phase, so each phase is a task rather than a redraw
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -233,25 +206,94 @@ def run_audiobook_mode(args, lines, speakers, voice_manager, provider, output_fo
         TaskProgressColumn(),
         console=console,
     ) as progress:
+        # Chunk the text
+        chunk_task = progress.add_task("Chunking text for audiobook mode...", total=1)
+        chunker = TextChunker(
+            max_bytes=3500,
+            max_speakers_per_chunk=2,
+            chapter_pause_ms=args.chapter_pause,
+        )
+        chunks = chunker.chunk(fuse_adjacent(lines))
+        stats = chunker.get_stats(chunks)
+        progress.update(chunk_task, completed=1, description=f"Created {stats['chunks']} chunks")
+
+        console.print(f"[dim]Estimated duration:[/dim] {stats['estimated_duration_min']:.1f} minutes")
+
+        # Create streaming generator
+        generator = StreamingGenerator(
+            provider=provider,
+            voice_manager=voice_manager,
+            output_path=wav_output_path,
+            pause_ms=args.pause,
+            chapter_pause_ms=args.chapter_pause,
+            cache=create_cache(args),
+        )
+
+        # Check for resume
+        state_path = generator.state_path
+        if args.resume and state_path.exists():
+            console.print("[yellow]Resuming from previous state...[/yellow]")
+        elif state_path.exists() and not args.resume:
+            console.print("[yellow]Warning:[/yellow] State file found. Use --resume to continue, or delete it to start fresh.")
+            if wav_output_path.exists():
+                wav_output_path.unlink()
+            state_path.unlink()
+
+        # Generate with progress
         task = progress.add_task("Generating audiobook...", total=len(chunks))
 
         def update_progress(current, total, gen_stats):
-            progress.update(task, completed=current)
             duration_sec = gen_stats.get("total_duration_ms", 0) / 1000
-            progress.update(task, description=f"Chunk {current}/{total} | {duration_sec:.0f}s generated")
-
-        generator.generate(
-            chunks,
-            progress_callback=update_progress,
-            resume=args.resume,
-        )
-
-    # Convert to MP3 if needed
-    if output_format == 'mp3':
-        console.print("[cyan]Converting to MP3...[/cyan]")
-        convert_to_mp3(wav_output_path, final_output_path, delete_wav=True)
+            progress.update(
+                task,
+                completed=current,
+                description=f"Chunk {current}/{total} | {duration_sec:.0f}s generated",
+            )
+
+        # Encode MP3 alongside generation rather than re-reading the WAV at the end.
+        # It goes to a temporary file that only replaces the output on success,
+        # so a failed run never leaves a truncated MP3 (resume replays the WAV).
+        mp3_writer = None
+        partial_mp3_path = final_output_path.with_suffix(".partial.mp3")
+        if output_format == 'mp3' and has_streaming_encoder():
+            mp3_writer = Mp3Writer(partial_mp3_path, TARGET_SAMPLE_RATE, TARGET_CHANNELS)
+
+        try:
+            generator.generate(
+                chunks,
+                progress_callback=update_progress,
+                resume=args.resume,
+                audio_callback=mp3_writer.write if mp3_writer else None,
+            )
+        except BaseException:
+            if mp3_writer:
+                try:
+                    mp3_writer.close()
+                finally:
+                    partial_mp3_path.unlink(missing_ok=True)
+            raise
+        if mp3_writer:
+            mp3_writer.close()
+            partial_mp3_path.replace(final_output_path)
+
+        # Per-chapter files are cut from the WAV, so do this before it is removed
+        chapter_paths = []
+        if args.split_chapters:
+            split_task = progress.add_task("Encoding chapters...", total=None)
+            chapter_dir = final_output_path.with_name(final_output_path.stem + "_chapters")
+            chapter_paths = split_wav_to_mp3(wav_output_path, generator.chapter_starts, chapter_dir)
+            progress.update(split_task, total=1, completed=1, description=f"Encoded {len(chapter_paths)} chapters")
+
+        if mp3_writer:
+            wav_output_path.unlink(missing_ok=True)
+        elif output_format == 'mp3':
+            encode_task = progress.add_task("Converting to MP3...", total=None)
+            convert_to_mp3(wav_output_path, final_output_path, delete_wav=True)
+            progress.update(encode_task, total=1, completed=1)
 
     console.print(f"[green]Success![/green] Audiobook saved to: {final_output_path}")
+    if chapter_paths:
+        console.print(f"[dim]Chapter files:[/dim] {chapter_paths[0].parent}")
     console.print(f"[dim]Total duration:[/dim] {generator.stats['total_duration_ms'] / 1000 / 60:.1f} minutes")
 
 
@@ -305,6 +347,32 @@ Note: MP3 format is recommended for audiobooks and web playback, as
         "--style",
         help="Style prompt for TTS (e.g., 'conversational, natural pace')",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent TTS requests in standard mode (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the TTS provider instead of reusing cached segments",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached segments (default: ~/.cache/tts-generator)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_CACHE_BYTES // (1024 * 1024),
+        help="Maximum cache size in MB; least recently used segments are evicted (default: 1024)",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete all cached segments and exit",
+    )
     parser.add_argument(
         "--list-voices",
         action="store_true",
@@ -337,11 +405,21 @@ Note: MP3 format is recommended for audiobooks and web playback, as
         default=2000,
         help="Pause duration at chapter breaks in ms (default: 2000)",
     )
+    parser.add_argument(
+        "--split-chapters",
+        action="store_true",
+        help="In audiobook mode, also write one MP3 per chapter to <output>_chapters/",
+    )
     parser.add_argument(
         "-y", "--yes",
         action="store_true",
         help="Skip confirmation prompts (overwrite existing files)",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show voice assignments, request count and estimated duration without generating",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -355,6 +433,12 @@ Note: MP3 format is recommended for audiobooks and web playback, as
         list_available_voices()
         return 0
 
+    if args.clear_cache:
+        cache = SegmentCache(args.cache_dir)
+        deleted = cache.clear()
+        console.print(f"Deleted {deleted} cached segments from {cache.cache_dir}")
+        return 0
+
     # Validate input file
     if not args.input:
         console.print("[red]Error:[/red] Input file required. Use --help for usage.")
@@ -365,9 +449,13 @@ Note: MP3 format is recommended for audiobooks and web playback, as
         console.print(f"[red]Error:[/red] Input file not found: {input_path}")
         return 1
 
-    # Validate file is readable
+    # Validate file is readable; a small probe avoids reading the whole file twice,
+    # and parse_file reports any invalid UTF-8 beyond it
     try:
-        input_path.read_text(encoding='utf-8')
+        with input_path.open('rb') as f:
+            head = f.read(INPUT_PROBE_BYTES)
+        # Incremental decode so a character split at the probe boundary is fine
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
     except PermissionError:
         console.print(f"[red]Error:[/red] Permission denied reading: {input_path}")
         return 1
@@ -377,7 +465,7 @@ Note: MP3 format is recommended for audiobooks and web playback, as
 
     # Check output file overwrite
     output_path = Path(args.output)
-    if output_path.exists() and not args.resume:
+    if output_path.exists() and not args.resume and not args.dry_run:
         if not args.yes and not confirm_overwrite(output_path):
             console.print("[yellow]Cancelled.[/yellow]")
             return 0
@@ -411,8 +499,7 @@ Note: MP3 format is recommended for audiobooks and web playback, as
             console.print(f"[cyan]Manual voices:[/cyan] {manual_assignments}")
 
         # Assign voices to all speakers
-        for speaker in speakers:
-            voice_manager.assign_voice(speaker)
+        voice_manager.assign_voices_bulk(speakers)
 
         if args.show_assignments:
             assignments = voice_manager.get_all_assignments()
@@ -423,7 +510,13 @@ Note: MP3 format is recommended for audiobooks and web playback, as
                 table.add_row(speaker, voice)
             console.print(table)
 
-        # Initialize TTS provider
+        if args.dry_run:
+            run_dry_run(args, lines, speakers, voice_manager)
+            return 0
+
+        # Initialize TTS provider (imported here so --help and --list-voices
+        # don't pay for loading the Google SDK)
+        from .providers import GoogleTTSProvider
         provider = GoogleTTSProvider(api_key=args.api_key)
         console.print("[cyan]Provider:[/cyan] google")
 
@@ -447,6 +540,9 @@ Note: MP3 format is recommended for audiobooks and web playback, as
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted.[/yellow] Use --resume to continue.")
         return 1
+    except UnicodeDecodeError:
+        console.print(f"[red]Error:[/red] File is not valid UTF-8 text: {input_path}")
+        return 1
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         return 1
@@ -4,23 +4,24 @@ from __future__ import annotations
 
 import atexit
 import os
-import shutil
-import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 import gradio as gr
+import numpy as np
 
+from .mp3 import Mp3Writer, convert_pcm_to_mp3, convert_to_mp3, has_streaming_encoder
 from .parser import parse_text_file, get_unique_speakers
 from .providers import GoogleTTSProvider
 from .splicer import AudioSplicer
-from .voices import VoiceManager, GOOGLE_VOICES, DEFAULT_VOICE_ASSIGNMENTS
+from .voices import VoiceManager, SORTED_GOOGLE_VOICES, DEFAULT_VOICE_ASSIGNMENTS
 from .chunker import TextChunker
-from .streaming import StreamingGenerator
+from .streaming import TARGET_CHANNELS, TARGET_SAMPLE_RATE, StreamingGenerator
 
 
 # Get list of voice names for dropdowns
-VOICE_CHOICES = sorted(GOOGLE_VOICES.keys())
+VOICE_CHOICES = [info.name for info in SORTED_GOOGLE_VOICES]
 
 # Output format choices
 FORMAT_CHOICES = ["WAV", "MP3"]
@@ -30,28 +31,19 @@ _temp_files: list[str] = []
 
 
 def convert_wav_to_mp3(wav_path: Path, mp3_path: Path) -> Path:
-    """Convert WAV file to MP3 using ffmpeg."""
-    if not shutil.which('ffmpeg'):
-        raise gr.Error("MP3 output requires ffmpeg. Install with: brew install ffmpeg")
-
-    cmd = [
-        'ffmpeg', '-y',
-        '-i', str(wav_path),
-        '-codec:a', 'libmp3lame',
-        '-qscale:a', '2',
-        str(mp3_path)
-    ]
-
+    """Convert WAV file to MP3, deleting the intermediate WAV."""
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
-    except subprocess.CalledProcessError as e:
-        raise gr.Error(f"ffmpeg conversion failed: {e.stderr}")
+        return convert_to_mp3(wav_path, mp3_path, delete_wav=True)
+    except RuntimeError as e:
+        raise gr.Error(str(e))
 
-    # Delete intermediate WAV
-    if wav_path.exists():
-        wav_path.unlink()
 
-    return mp3_path
+def _new_temp_path(suffix: str) -> Path:
+    """Create an empty temp file, tracked for cleanup, and return its path."""
+    temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    temp_file.close()
+    _temp_files.append(temp_file.name)
+    return Path(temp_file.name)
 
 
 def _cleanup_temp_files():
@@ -75,9 +67,13 @@ Patient: Just a bit tired, but overall good."""
 
 def get_default_voice(speaker):
     """Get default voice for a speaker."""
-    if speaker in DEFAULT_VOICE_ASSIGNMENTS:
-        return DEFAULT_VOICE_ASSIGNMENTS[speaker]
-    return "Kore"
+    return DEFAULT_VOICE_ASSIGNMENTS.get(speaker, "Kore")
+
+
+@lru_cache(maxsize=8)
+def _detect_unique_speakers(text: str) -> tuple[str, ...]:
+    """Parse text and return its speakers, cached so repeat clicks skip the parse."""
+    return tuple(get_unique_speakers(parse_text_file(text)))
 
 
 def detect_speakers(text):
@@ -90,8 +86,7 @@ def detect_speakers(text):
             gr.update(label="Speaker 4", value="Fenrir", visible=False),
         ]
 
-    lines = parse_text_file(text)
-    speakers = get_unique_speakers(lines)
+    speakers = _detect_unique_speakers(text)
 
     updates = []
     for i in range(4):
@@ -141,54 +136,74 @@ def generate_audio(text, voice1, voice2, voice3, voice4, pause_ms, audiobook_mod
     # Determine if we need MP3 output
     want_mp3 = output_format == "MP3"
 
-    # Create temp file for WAV output
-    temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    wav_path = Path(temp_file.name)
-    temp_file.close()
-
-    # Track temp file for cleanup
-    _temp_files.append(str(wav_path))
-
-    if audiobook_mode:
-        # Audiobook mode: chunk and stream
-        chunker = TextChunker(
-            max_bytes=3500,
-            max_speakers_per_chunk=2,
-            chapter_pause_ms=int(chapter_pause_ms),
-        )
-        chunks = chunker.chunk(lines)
-
-        if not chunks:
-            raise gr.Error("No chunks generated from text")
-
-        # Create streaming generator
-        generator = StreamingGenerator(
-            provider=provider,
-            voice_manager=voice_manager,
-            output_path=wav_path,
-            pause_ms=int(pause_ms),
-            chapter_pause_ms=int(chapter_pause_ms),
-        )
-
-        # Generate with progress
-        def update_progress(current, total, stats):
-            progress(current / total, desc=f"Generating chunk {current}/{total}")
-
-        generator.generate(chunks, progress_callback=update_progress)
-    else:
-        # Standard mode
+    if not audiobook_mode:
+        # Standard mode: the whole conversation is in memory, so hand it to
+        # Gradio directly rather than round-tripping through a temp WAV
         splicer = AudioSplicer(
             provider=provider,
             voice_manager=voice_manager,
             pause_ms=int(pause_ms),
         )
         audio = splicer.generate_conversation(lines)
-        splicer.export(audio, wav_path)
+        pcm, sample_rate, channels = splicer.export_pcm(audio)
 
-    # Convert to MP3 if requested
+        if not want_mp3:
+            samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels)
+            return sample_rate, samples
+
+        # Encode MP3 straight from memory, no intermediate WAV
+        mp3_path = _new_temp_path(".mp3")
+        try:
+            convert_pcm_to_mp3(pcm, sample_rate, channels, mp3_path)
+        except RuntimeError as e:
+            raise gr.Error(str(e))
+        return str(mp3_path)
+
+    # Audiobook mode: chunk and stream to a temp WAV
+    wav_path = _new_temp_path(".wav")
+    mp3_path = wav_path.with_suffix('.mp3')
     if want_mp3:
-        mp3_path = wav_path.with_suffix('.mp3')
         _temp_files.append(str(mp3_path))
+
+    chunker = TextChunker(
+        max_bytes=3500,
+        max_speakers_per_chunk=2,
+        chapter_pause_ms=int(chapter_pause_ms),
+    )
+    chunks = chunker.chunk(lines)
+
+    if not chunks:
+        raise gr.Error("No chunks generated from text")
+
+    # Create streaming generator
+    generator = StreamingGenerator(
+        provider=provider,
+        voice_manager=voice_manager,
+        output_path=wav_path,
+        pause_ms=int(pause_ms),
+        chapter_pause_ms=int(chapter_pause_ms),
+    )
+
+    # Generate with progress
+    def update_progress(current, total, stats):
+        progress(current / total, desc=f"Generating chunk {current}/{total}")
+
+    # Encode MP3 alongside generation when possible; the WAV is still
+    # needed by the generator for crossfading
+    if want_mp3 and has_streaming_encoder():
+        with Mp3Writer(mp3_path, TARGET_SAMPLE_RATE, TARGET_CHANNELS) as mp3_writer:
+            generator.generate(
+                chunks,
+                progress_callback=update_progress,
+                audio_callback=mp3_writer.write,
+            )
+        wav_path.unlink(missing_ok=True)
+        return str(mp3_path)
+
+    generator.generate(chunks, progress_callback=update_progress)
+
+    # Convert to MP3 if requested
+    if want_mp3:
         convert_wav_to_mp3(wav_path, mp3_path)
         return str(mp3_path)
 
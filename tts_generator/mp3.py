@@ -0,0 +1,321 @@
+"""MP3 encoding for generated audio."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+
+# Optional in-process encoder (falls back to ffmpeg when not installed)
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
+
+
+MP3_BIT_RATE = 192  # kbps
+MP3_QUALITY = 2  # LAME quality (2 = high)
+
+# Frames read per block when encoding a WAV file, so long audiobooks are
+# never held in memory at once (one minute at 24kHz)
+WAV_BLOCK_FRAMES = 24000 * 60
+
+# Lines of ffmpeg stderr kept for error messages
+FFMPEG_STDERR_TAIL_LINES = 200
+
+
+def _create_encoder(sample_rate: int, channels: int) -> "lameenc.Encoder":
+    """Create a LAME encoder for 16-bit PCM input."""
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(MP3_BIT_RATE)
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(channels)
+    encoder.set_quality(MP3_QUALITY)
+    return encoder
+
+
+def has_streaming_encoder() -> bool:
+    """Check whether Mp3Writer can encode PCM incrementally."""
+    return lameenc is not None or _ffmpeg_path() is not None
+
+
+class Mp3Writer:
+    """Incrementally encode 16-bit PCM blocks to an MP3 file.
+
+    Lets audio be encoded as it is generated, instead of re-reading a
+    finished WAV. Uses lameenc in-process when available, otherwise pipes
+    the PCM into an ffmpeg subprocess.
+    """
+
+    def __init__(self, mp3_path: str | Path, sample_rate: int, channels: int):
+        """Open the output file.
+
+        Args:
+            mp3_path: Path for output MP3 file
+            sample_rate: Sample rate of the PCM data
+            channels: Number of interleaved channels
+
+        Raises:
+            RuntimeError: If neither lameenc nor ffmpeg is available
+        """
+        self.path = Path(mp3_path)
+        self._encoder = None
+        self._file = None
+        self._process = None
+
+        if lameenc is not None:
+            self._encoder = _create_encoder(sample_rate, channels)
+            self._file = open(self.path, 'wb')
+        else:
+            self._process, self._stderr_reader, self._stderr_tail = _start_ffmpeg(
+                _ffmpeg_pcm_command(sample_rate, channels, self.path),
+                stdin=subprocess.PIPE,
+            )
+
+    def write(self, pcm: bytes):
+        """Encode a block of raw PCM and append it to the file."""
+        if self._encoder is not None:
+            self._file.write(self._encoder.encode(pcm))
+            return
+
+        try:
+            self._process.stdin.write(pcm)
+        except BrokenPipeError:
+            # ffmpeg exited early; close() reports its error output
+            self.close()
+            raise RuntimeError("ffmpeg conversion failed: encoder exited early")
+
+    def close(self) -> Path:
+        """Flush the encoder and close the file.
+
+        Returns:
+            Path to the MP3 file
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        if self._encoder is not None:
+            if not self._file.closed:
+                self._file.write(self._encoder.flush())
+                self._file.close()
+        elif self._process.returncode is None:
+            try:
+                self._process.stdin.close()
+            except BrokenPipeError:
+                pass
+            _wait_ffmpeg(self._process, self._stderr_reader, self._stderr_tail)
+        return self.path
+
+    def __enter__(self) -> "Mp3Writer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def convert_pcm_to_mp3(pcm: bytes, sample_rate: int, channels: int, mp3_path: str | Path) -> Path:
+    """Encode raw 16-bit PCM directly to an MP3 file.
+
+    Uses lameenc in-process when available; otherwise pipes the PCM into
+    ffmpeg. Either way no intermediate WAV is written.
+
+    Args:
+        pcm: Raw little-endian 16-bit PCM samples
+        sample_rate: Sample rate of the PCM data
+        channels: Number of interleaved channels
+        mp3_path: Path for output MP3 file
+
+    Returns:
+        Path to the MP3 file
+
+    Raises:
+        RuntimeError: If no MP3 encoder is available or conversion fails
+    """
+    with Mp3Writer(mp3_path, sample_rate, channels) as writer:
+        writer.write(pcm)
+    return writer.path
+
+
+def convert_to_mp3(wav_path: Path, mp3_path: Path, delete_wav: bool = True) -> Path:
+    """Convert a 16-bit WAV file to MP3.
+
+    Uses lameenc in-process when available, reading the WAV in blocks;
+    otherwise shells out to ffmpeg.
+
+    Args:
+        wav_path: Path to input WAV file
+        mp3_path: Path for output MP3 file
+        delete_wav: Whether to delete the intermediate WAV file
+
+    Returns:
+        Path to the MP3 file
+
+    Raises:
+        RuntimeError: If no MP3 encoder is available or conversion fails
+    """
+    if lameenc is not None:
+        with wave.open(str(wav_path), 'rb') as wav, open(mp3_path, 'wb') as out:
+            encoder = _create_encoder(wav.getframerate(), wav.getnchannels())
+            while True:
+                frames = wav.readframes(WAV_BLOCK_FRAMES)
+                if not frames:
+                    break
+                out.write(encoder.encode(frames))
+            out.write(encoder.flush())
+    else:
+        _ffmpeg_convert(wav_path, mp3_path)
+
+    # Delete intermediate WAV if requested
+    if delete_wav and wav_path.exists():
+        wav_path.unlink()
+
+    return mp3_path
+
+
+@cache
+def _ffmpeg_path() -> str | None:
+    """Locate ffmpeg on PATH once per process."""
+    return shutil.which('ffmpeg')
+
+
+def encode_wav_range(wav_path: Path, start_frame: int, end_frame: int, mp3_path: Path) -> Path:
+    """Encode frames [start_frame, end_frame) of a 16-bit WAV file to MP3.
+
+    Reads only the requested range, in blocks, so it can run in a worker
+    process without the audio being passed to it.
+
+    Args:
+        wav_path: Path to input WAV file
+        start_frame: First frame to encode
+        end_frame: Frame to stop before
+        mp3_path: Path for output MP3 file
+
+    Returns:
+        Path to the MP3 file
+    """
+    with wave.open(str(wav_path), 'rb') as wav:
+        frame_size = wav.getsampwidth() * wav.getnchannels()
+        wav.setpos(start_frame)
+        with Mp3Writer(mp3_path, wav.getframerate(), wav.getnchannels()) as writer:
+            remaining = end_frame - start_frame
+            while remaining > 0:
+                frames = wav.readframes(min(remaining, WAV_BLOCK_FRAMES))
+                if not frames:
+                    break
+                writer.write(frames)
+                remaining -= len(frames) // frame_size
+    return Path(mp3_path)
+
+
+def split_wav_to_mp3(
+    wav_path: Path,
+    start_frames: list[int],
+    output_dir: Path,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Encode each section of a WAV file to its own MP3, in parallel.
+
+    MP3 encoding is CPU-bound and each section is independent, so sections
+    are spread across worker processes.
+
+    Args:
+        wav_path: Path to input WAV file
+        start_frames: Frames where each section after the first begins
+        output_dir: Directory for the section files (ch001.mp3, ch002.mp3, ...)
+        max_workers: Maximum worker processes (default: CPU count)
+
+    Returns:
+        Paths to the MP3 files, in order
+    """
+    with wave.open(str(wav_path), 'rb') as wav:
+        total_frames = wav.getnframes()
+
+    bounds = [0, *start_frames, total_frames]
+    sections = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    mp3_paths = [output_dir / f"ch{n:03d}.mp3" for n in range(1, len(sections) + 1)]
+
+    workers = min(len(sections), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(encode_wav_range, wav_path, start, end, mp3_path)
+            for (start, end), mp3_path in zip(sections, mp3_paths)
+        ]
+        return [future.result() for future in futures]
+
+
+def _require_ffmpeg() -> str:
+    """Return the ffmpeg path, raising if it is unavailable for the fallback encoder."""
+    ffmpeg = _ffmpeg_path()
+    if not ffmpeg:
+        raise RuntimeError(
+            "MP3 output requires lameenc or ffmpeg. "
+            "Install with: pip install lameenc (or: brew install ffmpeg)"
+        )
+    return ffmpeg
+
+
+def _ffmpeg_pcm_command(sample_rate: int, channels: int, mp3_path: Path) -> list[str]:
+    """Build an ffmpeg command encoding raw 16-bit PCM from stdin to MP3."""
+    return [
+        _require_ffmpeg(), '-y',  # Overwrite output
+        '-loglevel', 'error',
+        '-f', 's16le',
+        '-ar', str(sample_rate),
+        '-ac', str(channels),
+        '-i', 'pipe:0',
+        '-codec:a', 'libmp3lame',
+        '-qscale:a', '2',  # High quality VBR
+        str(mp3_path)
+    ]
+
+
+def _ffmpeg_convert(wav_path: Path, mp3_path: Path):
+    """Convert WAV file to MP3 using an ffmpeg subprocess."""
+    # Run ffmpeg conversion
+    cmd = [
+        _require_ffmpeg(), '-y',  # Overwrite output
+        '-i', str(wav_path),
+        '-codec:a', 'libmp3lame',
+        '-qscale:a', '2',  # High quality VBR
+        str(mp3_path)
+    ]
+
+    process, reader, tail = _start_ffmpeg(cmd)
+    _wait_ffmpeg(process, reader, tail)
+
+
+def _start_ffmpeg(cmd: list[str], stdin=None) -> tuple[subprocess.Popen, threading.Thread, deque]:
+    """Start ffmpeg, draining its stderr into a bounded tail on a background thread.
+
+    Reading stderr continuously keeps ffmpeg from blocking on a full pipe
+    during long encodes, without holding all of its output in memory.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    tail: deque[bytes] = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    reader = threading.Thread(target=tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+    return process, reader, tail
+
+
+def _wait_ffmpeg(process: subprocess.Popen, reader: threading.Thread, tail: deque):
+    """Wait for ffmpeg to exit, raising with its last stderr lines on failure."""
+    returncode = process.wait()
+    reader.join()
+    process.stderr.close()
+    if returncode:
+        stderr = b"".join(tail).decode(errors='replace')
+        raise RuntimeError(f"ffmpeg conversion failed:\n{stderr}")
@@ -4,15 +4,54 @@ from __future__ import annotations
 
 import json
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
+# Optional faster JSON parser (falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def utf8_len(text: str) -> int:
+    """Get UTF-8 byte length, skipping the encode for ASCII text."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+@dataclass(slots=True)
 class DialogueLine:
     """A single line of dialogue."""
     speaker: str
     text: str
+    # UTF-8 size of text, computed once so chunking never re-encodes
+    text_bytes: int = field(init=False, repr=False, compare=False)
+    # Approximate word count, for duration estimates
+    word_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Speakers repeat on every line; interning makes comparisons identity checks
+        self.speaker = sys.intern(self.speaker)
+        self.text_bytes = utf8_len(self.text)
+        # Count separators instead of allocating a str.split() list
+        self.word_count = self.text.count(' ') + 1 if self.text else 0
+
+
+# Pattern to match speaker labels like "Speaker A:", "Provider:", etc.
+# Requirements:
+# - Must start with a letter (not purely numeric like timestamps "10:30")
+# - Can contain letters, numbers, and spaces
+# - Must be followed by colon and then dialogue text
+# - Negative lookahead to exclude URLs (http:, https:, ftp:)
+# Compiled once here, since the GUI re-parses on every speaker detection.
+# Lines are stripped before matching, so the groups need no further strip.
+_SPEAKER_RE = re.compile(
+    r'^(?!https?:|ftp:)'  # Exclude URLs
+    r'([A-Za-z][A-Za-z0-9 ]*?) *'  # Speaker name (must start with letter)
+    r':\s*(.*)$'  # Colon followed by optional dialogue
+)
 
 
 def parse_text_file(content: str) -> list[DialogueLine]:
@@ -24,27 +63,20 @@ def parse_text_file(content: str) -> list[DialogueLine]:
     current_speaker = None
     current_text = []
 
-    # Pattern to match speaker labels like "Speaker A:", "Provider:", etc.
-    # Requirements:
-    # - Must start with a letter (not purely numeric like timestamps "10:30")
-    # - Can contain letters, numbers, and spaces
-    # - Must be followed by colon and then dialogue text
-    # - Negative lookahead to exclude URLs (http:, https:, ftp:)
-    speaker_pattern = re.compile(
-        r'^(?!https?:|ftp:)'  # Exclude URLs
-        r'([A-Za-z][A-Za-z0-9 ]*)'  # Speaker name (must start with letter)
-        r':\s*(.*)$'  # Colon followed by optional dialogue
-    )
-
-    for line in content.split('\n'):
+    for line in content.splitlines():
         line = line.strip()
         if not line:
             continue
 
-        match = speaker_pattern.match(line)
+        # Lines without a colon can't carry a speaker label; skip the regex
+        if ':' not in line:
+            if current_speaker:
+                current_text.append(line)
+            continue
+
+        match = _SPEAKER_RE.match(line)
         if match:
-            speaker_name = match.group(1).strip()
-            dialogue = match.group(2).strip()
+            speaker_name, dialogue = match.groups()
 
             # Additional validation: reject if speaker name is too short or suspicious
             # (helps avoid matching things like "A: B" in technical content)
@@ -75,38 +107,33 @@ def parse_text_file(content: str) -> list[DialogueLine]:
     return lines
 
 
-def parse_json_file(content: str) -> list[DialogueLine]:
+def parse_json_file(content: str | bytes) -> list[DialogueLine]:
     """Parse JSON format: [{speaker: "...", text: "..."}, ...]"""
-    data = json.loads(content)
-
-    lines = []
-    for item in data:
-        speaker = item.get('speaker', '').strip()
-        text = item.get('text', '').strip()
-        if speaker and text:
-            lines.append(DialogueLine(speaker=speaker, text=text))
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
 
-    return lines
+    return [
+        DialogueLine(speaker=speaker, text=text)
+        for item in data
+        if (speaker := item.get('speaker', '').strip())
+        and (text := item.get('text', '').strip())
+    ]
 
 
 def parse_file(file_path: str | Path) -> list[DialogueLine]:
     """Parse input file, auto-detecting format from extension."""
     path = Path(file_path)
-    content = path.read_text(encoding='utf-8')
 
     if path.suffix.lower() == '.json':
-        return parse_json_file(content)
+        # orjson parses UTF-8 bytes directly, skipping a separate decode
+        if orjson is not None:
+            return parse_json_file(path.read_bytes())
+        return parse_json_file(path.read_text(encoding='utf-8'))
     else:
         # Default to text format
-        return parse_text_file(content)
+        return parse_text_file(path.read_text(encoding='utf-8'))
 
 
 def get_unique_speakers(lines: list[DialogueLine]) -> list[str]:
     """Get list of unique speakers in order of appearance."""
-    seen = set()
-    speakers = []
-    for line in lines:
-        if line.speaker not in seen:
-            seen.add(line.speaker)
-            speakers.append(line.speaker)
-    return speakers
+    # dict keys keep insertion order, so this dedupes in C without a seen-set loop
+    return list(dict.fromkeys(map(attrgetter('speaker'), lines)))
@@ -1,13 +1,27 @@
 """TTS Provider implementations."""
 
 from .base import TTSProvider, AudioSegment
-from .google_tts import GoogleTTSProvider
 
-__all__ = ["TTSProvider", "AudioSegment", "GoogleTTSProvider"]
+# ElevenLabsProvider is None when its SDK can't be imported
+__all__ = ["TTSProvider", "AudioSegment", "GoogleTTSProvider", "ElevenLabsProvider"]
 
-# Optional ElevenLabs import (has dependency issues with some Python versions)
-try:
-    from .elevenlabs import ElevenLabsProvider
-    __all__.append("ElevenLabsProvider")
-except ImportError:
-    ElevenLabsProvider = None
+
+def __getattr__(name):
+    # Provider SDKs are slow to import, so load them on first use rather than
+    # whenever anything under tts_generator.providers is imported
+    if name == "GoogleTTSProvider":
+        from .google_tts import GoogleTTSProvider as value
+
+    # Optional ElevenLabs import (has dependency issues with some Python versions)
+    elif name == "ElevenLabsProvider":
+        try:
+            from .elevenlabs import ElevenLabsProvider as value
+        except ImportError:
+            value = None
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Later lookups find the module attribute and skip __getattr__
+    globals()[name] = value
+    return value
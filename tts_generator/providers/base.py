@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import random
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import wraps
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioSegment:
     """A segment of generated audio."""
     data: bytes
@@ -15,6 +21,89 @@ class AudioSegment:
     sample_width: int = 2  # 16-bit
 
 
+# Statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(headers) -> float | None:
+    """Get the delay a Retry-After header asks for, in seconds.
+
+    Args:
+        headers: Response headers, or None
+
+    Returns:
+        The delay, or None if absent or not a number of seconds
+    """
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after") or headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        # Missing, or an HTTP date rather than a number of seconds
+        return None
+
+
+def retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    should_retry: Callable[[Exception], bool] | None = None,
+    retry_after: Callable[[Exception], float | None] | None = None,
+    jitter: bool = False,
+):
+    """Decorator for retrying API calls with exponential backoff.
+
+    Works on both regular functions and coroutine functions; the latter
+    wait with asyncio.sleep so the event loop keeps running.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        base_delay: Initial delay in seconds
+        max_delay: Maximum delay between retries
+        should_retry: Optional predicate; errors it rejects are raised immediately
+        retry_after: Optional callable returning a server-requested delay for an error
+        jitter: Randomize each backoff delay, so concurrent callers spread out
+    """
+    def next_delay(attempt: int, e: Exception) -> float:
+        """Raise e if it isn't retried, otherwise return the delay before retrying."""
+        if should_retry is not None and not should_retry(e):
+            raise e
+        if attempt >= max_retries:
+            raise e
+        delay = min(base_delay * (2 ** attempt), max_delay)
+        if jitter:
+            delay = random.uniform(0, delay)
+        requested = retry_after(e) if retry_after is not None else None
+        if requested is not None:
+            delay = min(max(delay, requested), max_delay)
+        print(f"API call failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+        print(f"Retrying in {delay:.1f}s...")
+        return delay
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = next_delay(attempt, e)
+                    await asyncio.sleep(delay)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    delay = next_delay(attempt, e)
+                time.sleep(delay)
+        return wrapper
+    return decorator
+
+
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
 
@@ -54,6 +143,31 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def generate_single_speaker_async(
+        self,
+        text: str,
+        voice: str,
+        style_prompt: str | None = None
+    ) -> AudioSegment:
+        """Async version of generate_single_speaker.
+
+        Providers with an async client override this; by default the
+        blocking call runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_single_speaker, text, voice, style_prompt)
+
+    async def generate_multi_speaker_async(
+        self,
+        dialogue: list[tuple[str, str, str]],  # [(speaker, voice, text), ...]
+        style_prompt: str | None = None
+    ) -> AudioSegment:
+        """Async version of generate_multi_speaker.
+
+        Providers with an async client override this; by default the
+        blocking call runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_multi_speaker, dialogue, style_prompt)
+
     @abstractmethod
     def max_speakers_per_call(self) -> int:
         """Return the maximum number of speakers per API call."""
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import os
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 
+import httpx
 from elevenlabs import ElevenLabs
 
-from .base import AudioSegment, TTSProvider
+from ..cache import SegmentCache
+from .base import (
+    RETRYABLE_STATUS_CODES,
+    AudioSegment,
+    TTSProvider,
+    parse_retry_after,
+    retry_with_backoff,
+)
 
 
 # Default ElevenLabs voice IDs (these are example IDs, users should configure their own)
@@ -24,14 +34,47 @@ ELEVENLABS_VOICE_MAP = {
 }
 
 
+def _error_response(exc: Exception) -> tuple[int | None, object]:
+    """Get (status code, headers) from an SDK or httpx error, if it has them."""
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(response, "status_code", None)
+    headers = getattr(exc, "headers", None) or getattr(response, "headers", None)
+    return status, headers
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Check whether a failed request is worth retrying."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    status, _ = _error_response(exc)
+    return status in RETRYABLE_STATUS_CODES
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Get the delay a rate-limited response asked for, in seconds."""
+    _, headers = _error_response(exc)
+    return parse_retry_after(headers)
+
+
 class ElevenLabsProvider(TTSProvider):
     """TTS provider using ElevenLabs API."""
 
-    def __init__(self, api_key: str | None = None):
+    MODEL = "eleven_multilingual_v2"
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_TIMEOUT = 60  # seconds
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_workers: int | None = None,
+        cache: SegmentCache | None = None,
+    ):
         """Initialize the ElevenLabs provider.
 
         Args:
             api_key: ElevenLabs API key. If None, uses ELEVENLABS_API_KEY env var.
+            max_workers: Concurrent requests for multi-speaker dialogue. Defaults to 8.
+            cache: Optional cache for the per-line requests behind multi-speaker dialogue
         """
         self.api_key = api_key or os.environ.get("ELEVENLABS_API_KEY")
         if not self.api_key:
@@ -39,7 +82,26 @@ class ElevenLabsProvider(TTSProvider):
                 "ElevenLabs API key required. Set ELEVENLABS_API_KEY environment "
                 "variable or pass api_key parameter."
             )
-        self.client = ElevenLabs(api_key=self.api_key)
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.cache = cache
+
+        # One pooled HTTP client for every request, so follow-up segments reuse
+        # the open TLS connection instead of handshaking again
+        self._http = httpx.Client(
+            timeout=self.DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=max(16, self.max_workers)),
+        )
+        self.client = ElevenLabs(api_key=self.api_key, httpx_client=self._http)
+
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._http.close()
+
+    def __enter__(self) -> "ElevenLabsProvider":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _get_voice_id(self, voice_name: str) -> str:
         """Map voice name to ElevenLabs voice ID."""
@@ -64,14 +126,7 @@ class ElevenLabsProvider(TTSProvider):
         if style_prompt:
             content = f"[{style_prompt}] {text}"
 
-        audio_generator = self.client.text_to_speech.convert(
-            voice_id=voice_id,
-            text=content,
-            model_id="eleven_multilingual_v2",
-        )
-
-        # Collect all chunks from the generator
-        audio_data = b"".join(audio_generator)
+        audio_data = self._convert_with_retry(voice_id, content)
 
         return AudioSegment(
             data=audio_data,
@@ -80,6 +135,34 @@ class ElevenLabsProvider(TTSProvider):
             sample_width=2,
         )
 
+    @retry_with_backoff(
+        max_retries=4,
+        base_delay=0.5,
+        max_delay=20.0,
+        should_retry=_is_transient,
+        retry_after=_retry_after,
+        jitter=True,
+    )
+    def _convert_with_retry(self, voice_id: str, content: str) -> bytes:
+        """Make the text-to-speech call, retrying rate limits and transient errors.
+
+        Args:
+            voice_id: ElevenLabs voice ID
+            content: The text content to send
+
+        Returns:
+            The generated audio bytes
+        """
+        audio_generator = self.client.text_to_speech.convert(
+            voice_id=voice_id,
+            text=content,
+            model_id=self.MODEL,
+        )
+
+        # Collect all chunks from the generator; the response streams, so
+        # errors can surface here rather than at the call above
+        return b"".join(audio_generator)
+
     def generate_multi_speaker(
         self,
         dialogue: list[tuple[str, str, str]],  # [(speaker, voice, text), ...]
@@ -88,24 +171,62 @@ class ElevenLabsProvider(TTSProvider):
         """Generate audio for multiple speakers.
 
         ElevenLabs generates one speaker at a time, so we concatenate segments.
-        For proper multi-speaker, use the audio splicer which handles this better.
+        Consecutive lines in the same voice are sent as one request, and the
+        requests are independent, so they run concurrently and are joined
+        in dialogue order. With a cache, each request (a run of same-voice
+        lines) is cached on its own, so runs survive edits elsewhere in the
+        dialogue; a line only hits the cache within an identical run. For
+        proper multi-speaker, use the audio splicer which handles this better.
         """
         if len(dialogue) == 0:
             raise ValueError("Dialogue list cannot be empty")
 
-        all_audio = BytesIO()
+        def generate(entry: tuple[str, str, str]) -> AudioSegment:
+            _, voice, text = entry
+            if self.cache is None:
+                return self.generate_single_speaker(text, voice, style_prompt)
+            key = SegmentCache.make_key(self, [("", voice, text)], style_prompt)
+            return self.cache.get_or_compute(
+                key, lambda: self.generate_single_speaker(text, voice, style_prompt)
+            )
 
-        for speaker, voice, text in dialogue:
-            segment = self.generate_single_speaker(text, voice, style_prompt)
-            all_audio.write(segment.data)
+        requests = self._merge_same_voice(dialogue)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests))) as executor:
+            segments = list(executor.map(generate, requests))
 
         return AudioSegment(
-            data=all_audio.getvalue(),
+            data=b"".join(segment.data for segment in segments),
             sample_rate=44100,
             channels=1,
             sample_width=2,
         )
 
+    def _merge_same_voice(
+        self,
+        dialogue: list[tuple[str, str, str]],
+    ) -> list[tuple[str, str, str]]:
+        """Join the text of consecutive same-voice entries, within the length limit."""
+        limit = self.max_text_length()
+        merged: list[tuple[str, str, str]] = []
+
+        for voice, entries in groupby(dialogue, key=itemgetter(1)):
+            speaker = None
+            texts: list[str] = []
+            length = 0
+            for entry_speaker, _, text in entries:
+                if texts and length + 1 + len(text) > limit:
+                    merged.append((speaker, voice, " ".join(texts)))
+                    texts, length = [], 0
+                if not texts:
+                    speaker = entry_speaker
+                    length = len(text)
+                else:
+                    length += 1 + len(text)
+                texts.append(text)
+            merged.append((speaker, voice, " ".join(texts)))
+
+        return merged
+
     def max_speakers_per_call(self) -> int:
         """ElevenLabs generates one speaker at a time."""
         return 1
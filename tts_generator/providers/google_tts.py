@@ -4,40 +4,93 @@ from __future__ import annotations
 
 import base64
 import os
-import time
-from functools import wraps
+from functools import lru_cache
 
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+from ..parser import utf8_len
+from .base import (
+    RETRYABLE_STATUS_CODES,
+    AudioSegment,
+    TTSProvider,
+    parse_retry_after,
+    retry_with_backoff,
+)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Check whether a failed request is worth retrying."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, errors.APIError):
+        return exc.code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Get the delay a rate-limited response asked for, in seconds."""
+    response = getattr(exc, "response", None)
+    return parse_retry_after(getattr(response, "headers", None))
+
+
+@lru_cache(maxsize=256)
+def _generate_config(
+    voice: str | None = None,
+    speaker_voices: tuple[tuple[str, str], ...] | None = None,
+) -> types.GenerateContentConfig:
+    """Build the request config for a voice or (speaker, voice) pairs.
+
+    The same few voices recur on every call, so each config is built once
+    and reused instead of re-validating the nested models per request.
+    """
+    if speaker_voices:
+        # Multi-speaker mode
+        speaker_configs = [
+            types.SpeakerVoiceConfig(
+                speaker=speaker,
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=speaker_voice,
+                    )
+                )
+            )
+            for speaker, speaker_voice in speaker_voices
+        ]
+        return types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+                    speaker_voice_configs=speaker_configs
+                )
+            ),
+        )
 
-from .base import AudioSegment, TTSProvider
+    # Single speaker mode
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice,
+                )
+            )
+        ),
+    )
 
 
-def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
-    """Decorator for retrying API calls with exponential backoff.
+@lru_cache(maxsize=8)
+def _shared_client(api_key: str, timeout: int) -> genai.Client:
+    """Get the process-wide client for an API key and timeout.
 
-    Args:
-        max_retries: Maximum number of retry attempts
-        base_delay: Initial delay in seconds
-        max_delay: Maximum delay between retries
+    The GUI builds a provider per request, so sharing the client lets every
+    provider reuse the same pooled keep-alive connections.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        delay = min(base_delay * (2 ** attempt), max_delay)
-                        print(f"API call failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                        print(f"Retrying in {delay:.1f}s...")
-                        time.sleep(delay)
-            raise last_exception
-        return wrapper
-    return decorator
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(timeout=timeout * 1000),  # ms
+    )
 
 
 class GoogleTTSProvider(TTSProvider):
@@ -60,7 +113,9 @@ class GoogleTTSProvider(TTSProvider):
                 "variable or pass api_key parameter."
             )
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.client = genai.Client(api_key=self.api_key)
+        # One client (and its pooled HTTP connections) serves every provider
+        # using this key, so repeat requests skip the TLS handshake
+        self.client = _shared_client(self.api_key, self.timeout)
         self.debug = False  # Enable for verbose logging
 
     def _debug_log(self, message: str):
@@ -75,8 +130,28 @@ class GoogleTTSProvider(TTSProvider):
         style_prompt: str | None = None
     ) -> AudioSegment:
         """Generate audio for a single speaker."""
+        content = self._single_speaker_content(text, style_prompt)
+        response = self._call_api_with_retry(content, voice=voice)
+
+        # Extract audio data from response
+        audio_data = self._extract_audio(response)
+        return AudioSegment(data=audio_data)
+
+    async def generate_single_speaker_async(
+        self,
+        text: str,
+        voice: str,
+        style_prompt: str | None = None
+    ) -> AudioSegment:
+        """Generate audio for a single speaker using the async client."""
+        content = self._single_speaker_content(text, style_prompt)
+        response = await self._call_api_async_with_retry(content, voice=voice)
+        return AudioSegment(data=self._extract_audio(response))
+
+    def _single_speaker_content(self, text: str, style_prompt: str | None) -> str:
+        """Validate text and build the single-speaker request content."""
         # Validate text length
-        text_bytes = len(text.encode('utf-8'))
+        text_bytes = utf8_len(text)
         if text_bytes > self.max_text_length():
             raise ValueError(
                 f"Text too long ({text_bytes} bytes). Maximum is {self.max_text_length()} bytes. "
@@ -85,78 +160,114 @@ class GoogleTTSProvider(TTSProvider):
 
         # Build TTS instruction with optional style
         if style_prompt:
-            content = f"{style_prompt}\n\nTTS this: {text}"
-        else:
-            content = f"TTS this: {text}"
-
-        response = self._call_api_with_retry(content, voice=voice)
-
-        # Extract audio data from response
-        audio_data = self._extract_audio(response)
-        return AudioSegment(data=audio_data)
-
-    @retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=30.0)
-    def _call_api_with_retry(self, content: str, voice: str | None = None, speaker_configs: list | None = None):
-        """Make API call with retry logic.
+            return f"{style_prompt}\n\nTTS this: {text}"
+        return f"TTS this: {text}"
+
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=1.0,
+        max_delay=30.0,
+        should_retry=_is_transient,
+        retry_after=_retry_after,
+        jitter=True,
+    )
+    def _call_api_with_retry(
+        self,
+        content: str,
+        voice: str | None = None,
+        speaker_voices: tuple[tuple[str, str], ...] | None = None,
+    ):
+        """Make API call, retrying rate limits and transient errors.
 
         Args:
             content: The text content to send
             voice: Single speaker voice name (for single speaker mode)
-            speaker_configs: List of speaker configs (for multi-speaker mode)
+            speaker_voices: (speaker, voice) pairs (for multi-speaker mode)
 
         Returns:
             API response
         """
-        text_bytes = len(content.encode('utf-8'))
-        if speaker_configs:
-            speakers = [sc.speaker for sc in speaker_configs]
-            self._debug_log(f"API call: multi-speaker mode, speakers={speakers}, text={text_bytes} bytes")
-        else:
-            self._debug_log(f"API call: single-speaker mode, voice={voice}, text={text_bytes} bytes")
-
-        if speaker_configs:
-            # Multi-speaker mode
-            config = types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                        speaker_voice_configs=speaker_configs
-                    )
-                ),
-            )
-        else:
-            # Single speaker mode
-            config = types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                ),
-            )
-
+        self._log_call(content, voice, speaker_voices)
         return self.client.models.generate_content(
             model=self.MODEL,
             contents=content,
-            config=config,
+            config=_generate_config(voice, speaker_voices),
+        )
+
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=1.0,
+        max_delay=30.0,
+        should_retry=_is_transient,
+        retry_after=_retry_after,
+        jitter=True,
+    )
+    async def _call_api_async_with_retry(
+        self,
+        content: str,
+        voice: str | None = None,
+        speaker_voices: tuple[tuple[str, str], ...] | None = None,
+    ):
+        """Async version of _call_api_with_retry, using the client's aio API."""
+        self._log_call(content, voice, speaker_voices)
+        return await self.client.aio.models.generate_content(
+            model=self.MODEL,
+            contents=content,
+            config=_generate_config(voice, speaker_voices),
         )
 
+    def _log_call(
+        self,
+        content: str,
+        voice: str | None,
+        speaker_voices: tuple[tuple[str, str], ...] | None,
+    ):
+        """Log an API call in debug mode."""
+        # Only measure the payload when it is going to be logged; the callers
+        # already validated its size
+        if self.debug:
+            text_bytes = utf8_len(content)
+            if speaker_voices:
+                speakers = [speaker for speaker, _ in speaker_voices]
+                self._debug_log(f"API call: multi-speaker mode, speakers={speakers}, text={text_bytes} bytes")
+            else:
+                self._debug_log(f"API call: single-speaker mode, voice={voice}, text={text_bytes} bytes")
+
     def generate_multi_speaker(
         self,
         dialogue: list[tuple[str, str, str]],  # [(speaker, voice, text), ...]
         style_prompt: str | None = None
     ) -> AudioSegment:
         """Generate audio for multiple speakers (max 2 per call)."""
+        content, speaker_voices = self._multi_speaker_request(dialogue, style_prompt)
+        response = self._call_api_with_retry(content, speaker_voices=speaker_voices)
+
+        audio_data = self._extract_audio(response)
+        return AudioSegment(data=audio_data)
+
+    async def generate_multi_speaker_async(
+        self,
+        dialogue: list[tuple[str, str, str]],  # [(speaker, voice, text), ...]
+        style_prompt: str | None = None
+    ) -> AudioSegment:
+        """Generate audio for multiple speakers using the async client."""
+        content, speaker_voices = self._multi_speaker_request(dialogue, style_prompt)
+        response = await self._call_api_async_with_retry(content, speaker_voices=speaker_voices)
+        return AudioSegment(data=self._extract_audio(response))
+
+    def _multi_speaker_request(
+        self,
+        dialogue: list[tuple[str, str, str]],
+        style_prompt: str | None,
+    ) -> tuple[str, tuple[tuple[str, str], ...]]:
+        """Validate dialogue and build the request content and (speaker, voice) pairs."""
         if len(dialogue) == 0:
             raise ValueError("Dialogue list cannot be empty")
 
         # Get unique speakers in this dialogue segment
         speakers = {}
         for speaker, voice, _ in dialogue:
-            if speaker not in speakers:
-                speakers[speaker] = voice
+            speakers.setdefault(speaker, voice)
 
         if len(speakers) > 2:
             raise ValueError(
@@ -165,14 +276,10 @@ class GoogleTTSProvider(TTSProvider):
             )
 
         # Build dialogue text
-        lines = []
-        for speaker, _, text in dialogue:
-            lines.append(f"{speaker}: {text}")
-
-        dialogue_text = "\n".join(lines)
+        dialogue_text = "\n".join(f"{speaker}: {text}" for speaker, _, text in dialogue)
 
         # Validate text length
-        text_bytes = len(dialogue_text.encode('utf-8'))
+        text_bytes = utf8_len(dialogue_text)
         if text_bytes > self.max_text_length():
             raise ValueError(
                 f"Dialogue too long ({text_bytes} bytes). Maximum is {self.max_text_length()} bytes. "
@@ -185,57 +292,44 @@ class GoogleTTSProvider(TTSProvider):
         else:
             content = f"TTS the following conversation:\n{dialogue_text}"
 
-        # Build speaker voice configs
-        speaker_configs = []
-        for speaker, voice in speakers.items():
-            speaker_configs.append(
-                types.SpeakerVoiceConfig(
-                    speaker=speaker,
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                )
-            )
-
-        response = self._call_api_with_retry(content, speaker_configs=speaker_configs)
-
-        audio_data = self._extract_audio(response)
-        return AudioSegment(data=audio_data)
+        return content, tuple(speakers.items())
 
     def _extract_audio(self, response) -> bytes:
         """Extract audio bytes from API response.
 
         Validates response structure and provides helpful error messages.
         """
-        # Validate response structure
+        # Validate response structure; getattr with a default is one lookup
+        # where hasattr followed by access is two
         if not response:
             raise ValueError("Empty response from API")
 
-        if not hasattr(response, 'candidates') or not response.candidates:
+        candidates = getattr(response, 'candidates', None)
+        if not candidates:
             raise ValueError(
                 "Invalid API response: no candidates returned. "
                 "This may indicate a rate limit or API error."
             )
 
-        candidate = response.candidates[0]
-        if not hasattr(candidate, 'content') or not candidate.content:
+        content = getattr(candidates[0], 'content', None)
+        if not content:
             raise ValueError(
                 "Invalid API response: no content in candidate. "
                 "The API may have returned an error."
             )
 
-        if not hasattr(candidate.content, 'parts') or not candidate.content.parts:
+        parts = getattr(content, 'parts', None)
+        if not parts:
             raise ValueError(
                 "Invalid API response: no parts in content. "
                 "The model may not have generated audio."
             )
 
         # Extract audio data from parts
-        for part in candidate.content.parts:
-            if hasattr(part, 'inline_data') and part.inline_data:
-                data = part.inline_data.data
+        for part in parts:
+            inline_data = getattr(part, 'inline_data', None)
+            if inline_data:
+                data = inline_data.data
                 # Data is already raw bytes (audio/L16;codec=pcm;rate=24000)
                 if isinstance(data, bytes):
                     return data
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from pydub import AudioSegment as PydubSegment
 
+from .cache import SegmentCache
 from .parser import DialogueLine
 from .providers.base import AudioSegment, TTSProvider
 from .voices import VoiceManager
@@ -18,6 +21,11 @@ TARGET_SAMPLE_RATE = 24000
 TARGET_CHANNELS = 1
 TARGET_SAMPLE_WIDTH = 2  # 16-bit
 
+# Speaker groups sent to the provider at once, by either conversation path.
+# Groups are independent, latency-bound requests; more in flight finishes
+# sooner but risks provider rate limits, and all of them are billed.
+DEFAULT_CONCURRENCY = 4
+
 
 def normalize_audio(audio: PydubSegment) -> PydubSegment:
     """Normalize audio to target format for consistent concatenation."""
@@ -39,6 +47,18 @@ def group_dialogue_by_speaker_pairs(
     This is necessary because Google TTS only supports 2 speakers per API call.
     We create segments that can be processed independently and then spliced together.
     """
+    return [group for group, _ in _group_with_speakers(lines, max_speakers)]
+
+
+def _group_with_speakers(
+    lines: list[DialogueLine],
+    max_speakers: int = 2
+) -> list[tuple[list[DialogueLine], frozenset[str]]]:
+    """Group dialogue lines like group_dialogue_by_speaker_pairs.
+
+    Each group comes with the set of speakers in it, which grouping has to
+    track anyway, so callers don't rescan the group's lines for it.
+    """
     if not lines:
         return []
 
@@ -51,7 +71,7 @@ def group_dialogue_by_speaker_pairs(
         if line.speaker not in current_speakers and len(current_speakers) >= max_speakers:
             # Start a new group
             if current_group:
-                groups.append(current_group)
+                groups.append((current_group, frozenset(current_speakers)))
             current_group = [line]
             current_speakers = {line.speaker}
         else:
@@ -60,7 +80,7 @@ def group_dialogue_by_speaker_pairs(
 
     # Add the last group
     if current_group:
-        groups.append(current_group)
+        groups.append((current_group, frozenset(current_speakers)))
 
     return groups
 
@@ -83,6 +103,8 @@ class AudioSplicer:
         provider: TTSProvider,
         voice_manager: VoiceManager,
         pause_ms: int = 300,
+        cache: SegmentCache | None = None,
+        max_workers: int = DEFAULT_CONCURRENCY,
     ):
         """Initialize the audio splicer.
 
@@ -90,10 +112,14 @@ class AudioSplicer:
             provider: The TTS provider to use.
             voice_manager: Voice manager with speaker-voice assignments.
             pause_ms: Pause duration between speaker changes in milliseconds.
+            cache: Optional segment cache consulted before each provider call.
+            max_workers: Provider calls run at once by generate_conversation.
         """
         self.provider = provider
         self.voice_manager = voice_manager
         self.pause_ms = pause_ms
+        self.cache = cache
+        self.max_workers = max_workers
 
     def generate_conversation(
         self,
@@ -103,10 +129,14 @@ class AudioSplicer:
     ) -> PydubSegment:
         """Generate audio for an entire conversation, handling speaker limits.
 
+        Groups are independent, latency-bound requests, so up to max_workers
+        of them run at once in threads. Segments are spliced in their
+        original order regardless of completion order.
+
         Args:
             lines: List of DialogueLine objects.
             style_prompt: Optional style direction for TTS.
-            progress_callback: Optional callback(current, total) for progress updates.
+            progress_callback: Optional callback(completed, total) as each group finishes.
 
         Returns:
             PydubSegment containing the complete audio.
@@ -115,51 +145,192 @@ class AudioSplicer:
             raise ValueError("No dialogue lines provided")
 
         # Assign voices to all speakers first
-        for line in lines:
-            self.voice_manager.assign_voice(line.speaker)
+        self.voice_manager.assign_voices_bulk(line.speaker for line in lines)
 
         # Group dialogue by speaker limits
         max_speakers = self.provider.max_speakers_per_call()
-        groups = group_dialogue_by_speaker_pairs(lines, max_speakers)
+        groups = _group_with_speakers(lines, max_speakers)
 
         # Generate audio for each group
-        audio_segments = []
+        audio_segments: list[PydubSegment | None] = [None] * len(groups)
         total_groups = len(groups)
+        workers = max(1, min(self.max_workers, total_groups))
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(self._generate_group, group, style_prompt, speakers): i
+                for i, (group, speakers) in enumerate(groups)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                audio_segments[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(completed, total_groups)
+        finally:
+            # On failure, drop queued groups instead of making calls nobody will use
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        for i, group in enumerate(groups):
-            if progress_callback:
-                progress_callback(i + 1, total_groups)
-
-            # Build dialogue tuples for the provider
-            dialogue = [
-                (line.speaker, self.voice_manager.get_voice(line.speaker), line.text)
-                for line in group
-            ]
-
-            # Generate audio
-            if len(set(line.speaker for line in group)) == 1:
-                # Single speaker in this group
-                speaker, voice, text = dialogue[0]
-                # Combine all text for single speaker
-                combined_text = " ".join(d[2] for d in dialogue)
-                raw_audio = self.provider.generate_single_speaker(
-                    combined_text, voice, style_prompt
-                )
-            else:
-                # Multiple speakers
-                raw_audio = self.provider.generate_multi_speaker(
-                    dialogue, style_prompt
-                )
+        # Splice all segments together with pauses
+        return self._splice_segments(audio_segments)
 
-            # Normalize audio for consistent format
-            audio_segment = normalize_audio(convert_raw_to_pydub(raw_audio))
-            audio_segments.append(audio_segment)
+    async def generate_conversation_async(
+        self,
+        lines: list[DialogueLine],
+        style_prompt: str | None = None,
+        progress_callback: callable | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> PydubSegment:
+        """Generate audio for a conversation with concurrent provider calls.
+
+        Each speaker group is an independent, latency-bound request, so up to
+        `concurrency` of them run at once through the provider's async
+        methods. Segments are spliced in their original order regardless of
+        completion order.
+
+        Args:
+            lines: List of DialogueLine objects.
+            style_prompt: Optional style direction for TTS.
+            progress_callback: Optional callback(completed, total) as each group finishes.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            PydubSegment containing the complete audio.
+        """
+        if not lines:
+            raise ValueError("No dialogue lines provided")
+
+        # Assign voices up front so concurrent requests only read assignments
+        self.voice_manager.assign_voices_bulk(line.speaker for line in lines)
+
+        max_speakers = self.provider.max_speakers_per_call()
+        groups = _group_with_speakers(lines, max_speakers)
+        total_groups = len(groups)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def generate(
+            index: int,
+            group: list[DialogueLine],
+            speakers: frozenset[str],
+        ) -> tuple[int, PydubSegment]:
+            async with semaphore:
+                segment = await self._generate_group_async(group, style_prompt, speakers)
+            return index, segment
+
+        audio_segments: list[PydubSegment | None] = [None] * total_groups
+        tasks = [
+            asyncio.ensure_future(generate(i, group, speakers))
+            for i, (group, speakers) in enumerate(groups)
+        ]
+
+        try:
+            for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                index, segment = await next_done
+                audio_segments[index] = segment
+                if progress_callback:
+                    progress_callback(completed, total_groups)
+        except BaseException:
+            # On failure, drop the groups still waiting for a slot
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-        # Splice all segments together with pauses
         return self._splice_segments(audio_segments)
 
+    def _group_request(
+        self,
+        group: list[DialogueLine],
+        speakers: frozenset[str] | None = None,
+    ) -> tuple[list[tuple[str, str, str]], bool]:
+        """Build the provider request for one group of dialogue lines.
+
+        speakers is the group's set of speakers, if the caller already has it.
+
+        Returns:
+            Tuple of ((speaker, voice, text) entries, whether it is single-speaker).
+            A single-speaker request is one entry with all the text combined.
+        """
+        # Build dialogue tuples for the provider
+        dialogue = [
+            (line.speaker, self.voice_manager.get_voice(line.speaker), line.text)
+            for line in group
+        ]
+
+        if speakers is None:
+            speakers = frozenset(line.speaker for line in group)
+        if len(speakers) == 1:
+            # Combine all text for single speaker
+            combined_text = " ".join(line.text for line in group)
+            # Key on what is actually sent, so the speaker name doesn't matter
+            return [("", dialogue[0][1], combined_text)], True
+        return dialogue, False
+
+    def _generate_group(
+        self,
+        group: list[DialogueLine],
+        style_prompt: str | None = None,
+        speakers: frozenset[str] | None = None,
+    ) -> PydubSegment:
+        """Generate normalized audio for one group of dialogue lines.
+
+        speakers is the group's set of speakers, if the caller already has it.
+        """
+        request, single = self._group_request(group, speakers)
+
+        # Generate audio
+        if single:
+            _, voice, text = request[0]
+
+            def generate():
+                return self.provider.generate_single_speaker(text, voice, style_prompt)
+        else:
+            def generate():
+                return self.provider.generate_multi_speaker(request, style_prompt)
+
+        if self.cache is not None:
+            key = SegmentCache.make_key(self.provider, request, style_prompt)
+            raw_audio = self.cache.get_or_compute(key, generate)
+        else:
+            raw_audio = generate()
+
+        # Normalize audio for consistent format
+        return normalize_audio(convert_raw_to_pydub(raw_audio))
+
+    async def _generate_group_async(
+        self,
+        group: list[DialogueLine],
+        style_prompt: str | None = None,
+        speakers: frozenset[str] | None = None,
+    ) -> PydubSegment:
+        """Async version of _generate_group, using the provider's async methods."""
+        request, single = self._group_request(group, speakers)
+
+        if single:
+            _, voice, text = request[0]
+
+            def generate():
+                return self.provider.generate_single_speaker_async(text, voice, style_prompt)
+        else:
+            def generate():
+                return self.provider.generate_multi_speaker_async(request, style_prompt)
+
+        if self.cache is not None:
+            key = SegmentCache.make_key(self.provider, request, style_prompt)
+            raw_audio = await self.cache.get_or_compute_async(key, generate)
+        else:
+            raw_audio = await generate()
+
+        return normalize_audio(convert_raw_to_pydub(raw_audio))
+
     def _splice_segments(self, segments: list[PydubSegment]) -> PydubSegment:
-        """Splice audio segments together with pauses and crossfade."""
+        """Splice audio segments together with pauses and crossfade.
+
+        A crossfade only touches the last few milliseconds of the audio so
+        far, so just that tail is crossfaded with each new segment and the
+        pieces are joined once at the end, instead of copying the growing
+        result on every append.
+        """
         if not segments:
             raise ValueError("No segments to splice")
 
@@ -173,20 +344,60 @@ class AudioSplicer:
         )
 
         # Concatenate with pauses and small crossfade for smooth transitions
-        result = segments[0]
+        first = segments[0]
+        frame_size = first.sample_width * first.channels
+        pieces = [first.raw_data]
+        total_bytes = len(first.raw_data)
         crossfade_ms = 25  # Small crossfade to prevent click artifacts
 
         for segment in segments[1:]:
             # Add silence then segment with crossfade
             with_pause = silence + segment
             # Apply crossfade at boundary (min of crossfade_ms and segment lengths)
-            fade_duration = min(crossfade_ms, len(result), len(with_pause))
+            result_ms = round(1000 * (total_bytes // frame_size) / first.frame_rate)
+            fade_duration = min(crossfade_ms, result_ms, len(with_pause))
             if fade_duration >= 5:
-                result = result.append(with_pause, crossfade=fade_duration)
+                tail_size = min(
+                    fade_duration * first.frame_rate // 1000 * frame_size,
+                    total_bytes,
+                )
+                # The tail may span pieces if the last one is very short
+                while len(pieces[-1]) < tail_size:
+                    last = pieces.pop()
+                    pieces[-1] += last
+                head = pieces.pop()
+                tail = PydubSegment(
+                    data=head[len(head) - tail_size:],
+                    sample_width=first.sample_width,
+                    frame_rate=first.frame_rate,
+                    channels=first.channels,
+                )
+                pieces.append(head[:len(head) - tail_size])
+                joined = tail.append(with_pause, crossfade=fade_duration).raw_data
+                total_bytes -= tail_size
             else:
-                result = result + with_pause
+                joined = with_pause.raw_data
+            pieces.append(joined)
+            total_bytes += len(joined)
+
+        return PydubSegment(
+            data=b"".join(pieces),
+            sample_width=first.sample_width,
+            frame_rate=first.frame_rate,
+            channels=first.channels,
+        )
 
-        return result
+    def export_pcm(self, audio: PydubSegment) -> tuple[bytes, int, int]:
+        """Get audio as raw PCM for encoders that don't need a file.
+
+        Args:
+            audio: The audio to export.
+
+        Returns:
+            Tuple of (raw 16-bit PCM data, sample rate, channels).
+        """
+        audio = normalize_audio(audio)
+        return audio.raw_data, audio.frame_rate, audio.channels
 
     def export(
         self,
@@ -211,5 +422,7 @@ class AudioSplicer:
             if not format:
                 format = 'mp3'
 
-        audio.export(str(path), format=format)
+        # pydub writes WAV itself (ffmpeg is only used for other formats) and
+        # returns the file it opened, which would otherwise stay open
+        audio.export(str(path), format=format).close()
         return path
@@ -3,24 +3,39 @@
 from __future__ import annotations
 
 import json
+import math
+import os
+import struct
+import sys
 import time
 import wave
-from datetime import datetime
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from pydub import AudioSegment as PydubSegment
 
+from .cache import SegmentCache
 from .chunker import Chunk
 from .providers.base import TTSProvider
 from .splicer import convert_raw_to_pydub
 from .voices import VoiceManager
 
+# Optional faster JSON encoder for state saves (falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Target audio format for consistency (matches Google TTS output)
 TARGET_SAMPLE_RATE = 24000
 TARGET_CHANNELS = 1
 TARGET_SAMPLE_WIDTH = 2  # 16-bit
 
+# State journal records written before the file is compacted to the latest one
+STATE_COMPACT_RECORDS = 1000
+
 
 def normalize_audio(audio: PydubSegment) -> PydubSegment:
     """Normalize audio to target format for consistent concatenation.
@@ -38,9 +53,109 @@ def normalize_audio(audio: PydubSegment) -> PydubSegment:
     return audio
 
 
+def _silence_pcm(duration_ms: int) -> bytes:
+    """Get duration_ms of silence as raw PCM in the target format."""
+    frames = TARGET_SAMPLE_RATE * duration_ms // 1000
+    return bytes(frames * TARGET_SAMPLE_WIDTH * TARGET_CHANNELS)
+
+
+def _last_bytes(pieces: list[bytes | memoryview], size: int) -> bytes:
+    """Get the last size bytes of consecutive pieces of data, as one copy."""
+    tail = []
+    for piece in reversed(pieces):
+        if size <= 0:
+            break
+        piece = piece[-size:] if size < len(piece) else piece
+        tail.append(piece)
+        size -= len(piece)
+    return b"".join(reversed(tail))
+
+
+def _read_wav_layout(f) -> tuple[int, int]:
+    """Find the data chunk of an open WAV file.
+
+    Args:
+        f: WAV file opened in binary mode
+
+    Returns:
+        Tuple of (offset of the PCM data, size of the PCM data in bytes)
+
+    Raises:
+        ValueError: If the file is not a WAV file with a data chunk
+    """
+    f.seek(0)
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b'RIFF' or header[8:] != b'WAVE':
+        raise ValueError("Not a WAV file")
+
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        if chunk_id == b'data':
+            return f.tell(), chunk_size
+        # Chunks are word-aligned
+        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def _patch_wav_sizes(f, data_offset: int, data_size: int):
+    """Update the RIFF and data chunk sizes of an open WAV file."""
+    f.seek(4)
+    f.write(struct.pack('<I', data_offset - 8 + data_size))
+    f.seek(data_offset - 4)
+    f.write(struct.pack('<I', data_size))
+
+
+@lru_cache(maxsize=8)
+def _equal_power_ramps(frames: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Build (fade_out, fade_in) gains for an equal-power crossfade.
+
+    The gains follow a quarter cosine and sine, so fade_out² + fade_in² is 1
+    at every frame and the loudness stays even across the join. Every join
+    in a book uses the same length, so the ramps are built once and shared.
+    """
+    step = (math.pi / 2) / frames
+    fade_out = tuple(math.cos((i + 0.5) * step) for i in range(frames))
+    fade_in = tuple(math.sin((i + 0.5) * step) for i in range(frames))
+    return fade_out, fade_in
+
+
+def _blend_equal_power(outgoing: bytes, incoming: bytes, channels: int) -> bytes:
+    """Crossfade two equal-length runs of 16-bit PCM with an equal-power ramp.
+
+    Args:
+        outgoing: End of the earlier audio, faded out
+        incoming: Start of the later audio, faded in
+        channels: Interleaved channels per frame
+
+    Returns:
+        The blended PCM, the same length as each input
+    """
+    head = array('h', outgoing)
+    tail = array('h', incoming)
+    if sys.byteorder == 'big':
+        # WAV samples are little-endian
+        head.byteswap()
+        tail.byteswap()
+
+    fade_out, fade_in = _equal_power_ramps(len(head) // channels)
+    mixed = array('h', (
+        max(-32768, min(32767, round(a * fade_out[i // channels] + b * fade_in[i // channels])))
+        for i, (a, b) in enumerate(zip(head, tail))
+    ))
+    if sys.byteorder == 'big':
+        mixed.byteswap()
+    return mixed.tobytes()
+
+
 def crossfade_segments(seg1: PydubSegment, seg2: PydubSegment, crossfade_ms: int = 25) -> PydubSegment:
     """Join two audio segments with a crossfade to prevent clicking artifacts.
 
+    16-bit audio is blended with an equal-power ramp over just the overlap;
+    the rest of both segments is copied as raw bytes. Other formats fall
+    back to pydub's crossfade.
+
     Args:
         seg1: First audio segment
         seg2: Second audio segment
@@ -59,7 +174,29 @@ def crossfade_segments(seg1: PydubSegment, seg2: PydubSegment, crossfade_ms: int
         # Too short for meaningful crossfade
         return seg1 + seg2
 
-    return seg1.append(seg2, crossfade=crossfade_ms)
+    if (
+        seg1.sample_width != 2
+        or (seg1.sample_width, seg1.frame_rate, seg1.channels)
+        != (seg2.sample_width, seg2.frame_rate, seg2.channels)
+    ):
+        return seg1.append(seg2, crossfade=crossfade_ms)
+
+    channels = seg1.channels
+    # len() rounds to whole milliseconds, so clamp to the actual frame counts
+    frames = min(
+        crossfade_ms * seg1.frame_rate // 1000,
+        int(seg1.frame_count()),
+        int(seg2.frame_count()),
+    )
+    overlap = frames * channels * 2
+    mixed = _blend_equal_power(seg1.raw_data[-overlap:], seg2.raw_data[:overlap], channels)
+
+    return PydubSegment(
+        data=b"".join((seg1.raw_data[:-overlap], mixed, seg2.raw_data[overlap:])),
+        sample_width=seg1.sample_width,
+        frame_rate=seg1.frame_rate,
+        channels=channels,
+    )
 
 
 class StreamingGenerator:
@@ -74,6 +211,8 @@ class StreamingGenerator:
         chapter_pause_ms: int = 2000,
         state_save_interval: int = 5,
         crossfade_ms: int = 25,
+        cache: SegmentCache | None = None,
+        max_workers: int = 4,
     ):
         """Initialize streaming generator.
 
@@ -85,6 +224,8 @@ class StreamingGenerator:
             chapter_pause_ms: Pause at chapter breaks (ms)
             state_save_interval: Save state every N chunks (default: 5)
             crossfade_ms: Crossfade duration at chunk boundaries (default: 25ms)
+            cache: Optional segment cache consulted before each provider call
+            max_workers: Chunks synthesized at once ahead of the writer (default: 4)
         """
         self.provider = provider
         self.voice_manager = voice_manager
@@ -93,12 +234,34 @@ class StreamingGenerator:
         self.chapter_pause_ms = chapter_pause_ms
         self.state_save_interval = state_save_interval
         self.crossfade_ms = crossfade_ms
-
-        # State file for resume capability
-        self.state_path = self.output_path.with_suffix('.state.json')
-
-        # Track audio parameters for consistency checking
-        self._audio_params = None
+        self.cache = cache
+        self.max_workers = max_workers
+
+        # State journal for resume capability (one JSON record per line)
+        self.state_path = self.output_path.with_suffix('.state.jsonl')
+        self._state_records = 0
+        # Run-invariant fields as last written to the journal, and the voice
+        # manager's assignments_version they were taken at
+        self._state_header: dict | None = None
+        self._state_version: int | None = None
+
+        # Bytes at the end of the output a crossfade can still rewrite
+        frame_size = TARGET_SAMPLE_WIDTH * TARGET_CHANNELS
+        self._tail_bytes = -(-TARGET_SAMPLE_RATE * crossfade_ms // 1000) * frame_size
+
+        # Output frame where each chapter after the first begins (for splitting)
+        self.chapter_starts: list[int] = []
+
+        # Output file kept open during a run, and the layout of its data chunk
+        self._output = None
+        self._data_offset = 0
+        self._data_size = 0
+        # Copy of the last crossfade_ms of the output's data, so appends never read it back
+        self._prev_tail = b""
+
+        # Optional consumer of final PCM and how much of the output it has seen
+        self._audio_callback = None
+        self._emitted_bytes = 0
 
         # Track generation stats
         self.stats = {
@@ -113,13 +276,21 @@ class StreamingGenerator:
         chunks: list[Chunk],
         progress_callback: callable | None = None,
         resume: bool = False,
+        audio_callback: callable | None = None,
     ) -> Path:
         """Generate audio from chunks, streaming to disk.
 
+        Up to max_workers chunks are synthesized at once in threads while
+        finished chunks are appended, in order, on the calling thread.
+        Progress, state saves and the audio callback all follow that order.
+
         Args:
             chunks: List of text chunks to generate
             progress_callback: Optional callback(current, total, stats) for progress
             resume: Whether to resume from saved state
+            audio_callback: Optional callback(pcm_bytes) fed the output's raw PCM
+                in order, exactly once, as it becomes final (e.g. for streaming
+                encoders). On resume, previously written audio is replayed first.
 
         Returns:
             Path to generated audio file
@@ -132,154 +303,384 @@ class StreamingGenerator:
         if resume and self.state_path.exists():
             state = self._load_state()
             start_idx = state.get("completed_chunks", 0)
+            self.chapter_starts = state.get("chapter_starts", [])
             print(f"Resuming from chunk {start_idx + 1}/{len(chunks)}")
         else:
-            # Start fresh - remove any existing output
+            # Start fresh - remove any existing output and state
             if self.output_path.exists():
                 self.output_path.unlink()
+            self._cleanup_state()
+            self.chapter_starts = []
 
         self.stats["start_time"] = time.time()
+        self._audio_callback = audio_callback
+        self._emitted_bytes = 0
+
+        # Pauses are the same for every chunk, so build them once per run
+        pause_silence = _silence_pcm(self.pause_ms)
+        chapter_silence = _silence_pcm(self.chapter_pause_ms)
 
-        # Process each chunk
-        for i, chunk in enumerate(chunks[start_idx:], start=start_idx):
-            try:
-                # Generate audio for this chunk
-                audio = self._generate_chunk(chunk)
-
-                # Normalize audio to ensure consistent format
-                audio = normalize_audio(audio)
-
-                # Add pause between chunks (with crossfade for smooth transitions)
-                if i > 0:
-                    pause_duration = self.chapter_pause_ms if chunk.is_chapter_start else self.pause_ms
-                    silence = PydubSegment.silent(
-                        duration=pause_duration,
-                        frame_rate=TARGET_SAMPLE_RATE,
-                    )
-                    # Prepend silence, then we'll crossfade when appending
-                    audio = silence + audio
-
-                # Append to output file with crossfade
-                self._append_audio(audio, use_crossfade=(i > 0))
-
-                # Update stats
-                self.stats["chunks_completed"] = i + 1
-                self.stats["total_duration_ms"] += len(audio)
-
-                # Save state periodically (every N chunks, or on last chunk)
-                is_last_chunk = (i + 1) == len(chunks)
-                should_save = (i + 1) % self.state_save_interval == 0 or is_last_chunk
-                if should_save:
-                    self._save_state(i + 1, len(chunks))
-
-                # Progress callback
-                if progress_callback:
-                    progress_callback(i + 1, len(chunks), self.stats.copy())
-
-            except Exception as e:
-                self.stats["errors"].append({
-                    "chunk": i,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                })
-                # Save state so we can resume
-                self._save_state(i, len(chunks))
-                raise
+        # Assign voices up front so worker threads only read assignments
+        self.voice_manager.assign_voices_bulk(
+            line.speaker for chunk in chunks for line in chunk.lines
+        )
+
+        # Workers synthesize chunks ahead of the writer, which appends them in
+        # order; at most 2 * max_workers chunks are in flight at once
+        pending = iter(range(start_idx, len(chunks)))
+        futures: dict[int, Future] = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+
+        def submit_next():
+            idx = next(pending, None)
+            if idx is not None:
+                futures[idx] = executor.submit(self._generate_normalized, chunks[idx])
+
+        try:
+            for _ in range(2 * max(1, self.max_workers)):
+                submit_next()
+
+            for i in range(start_idx, len(chunks)):
+                chunk = chunks[i]
+                try:
+                    audio = futures.pop(i).result()
+                    submit_next()
+
+                    # Add pause between chunks (with crossfade for smooth transitions)
+                    silence = None
+                    pause_frames = 0
+                    if i > 0:
+                        silence = chapter_silence if chunk.is_chapter_start else pause_silence
+                        pause_frames = len(silence) // (TARGET_SAMPLE_WIDTH * TARGET_CHANNELS)
+
+                    # Append the pause and audio to the output file with crossfade
+                    start_frame = self._append_audio(audio, use_crossfade=(i > 0), prefix=silence)
+
+                    # Chapters begin after their pause, so split files start with speech
+                    if chunk.is_chapter_start and i > 0:
+                        self.chapter_starts.append(start_frame + pause_frames)
+
+                    # Update stats
+                    self.stats["chunks_completed"] = i + 1
+                    self.stats["total_duration_ms"] += len(audio) + pause_frames * 1000 // TARGET_SAMPLE_RATE
+
+                    # Save state periodically (every N chunks, or on last chunk)
+                    is_last_chunk = (i + 1) == len(chunks)
+                    should_save = (i + 1) % self.state_save_interval == 0 or is_last_chunk
+                    if should_save:
+                        self._save_state(i + 1, len(chunks))
+
+                    # Progress callback
+                    if progress_callback:
+                        progress_callback(i + 1, len(chunks), self.stats.copy())
+
+                except Exception as e:
+                    self.stats["errors"].append({
+                        "chunk": i,
+                        "error": str(e),
+                        "timestamp": time.time(),
+                    })
+                    # Save state so we can resume
+                    self._save_state(i, len(chunks))
+                    raise
+        finally:
+            # On failure, drop chunks that have not started; running ones finish
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._close_output()
+
+        # Hand over the tail that was held back for crossfading
+        self._emit_file_pcm()
 
         # Clean up state file on completion
         self._cleanup_state()
 
         return self.output_path
 
+    def _generate_normalized(self, chunk: Chunk) -> PydubSegment:
+        """Generate a chunk's audio in the target format (runs in a worker)."""
+        return normalize_audio(self._generate_chunk(chunk))
+
     def _generate_chunk(self, chunk: Chunk) -> PydubSegment:
         """Generate audio for a single chunk."""
-        # Build dialogue tuples
-        dialogue = [
-            (line.speaker, self.voice_manager.get_voice(line.speaker), line.text)
-            for line in chunk.lines
-        ]
+        # The chunker records each chunk's speakers; look up their voices once
+        speakers = chunk.speakers or dict.fromkeys(line.speaker for line in chunk.lines)
+        voices = {speaker: self.voice_manager.get_voice(speaker) for speaker in speakers}
 
         # Generate based on number of speakers
-        unique_speakers = set(line.speaker for line in chunk.lines)
-
-        if len(unique_speakers) == 1:
+        if len(voices) == 1:
             # Single speaker - combine all text
-            speaker, voice, _ = dialogue[0]
-            combined_text = " ".join(d[2] for d in dialogue)
-            raw_audio = self.provider.generate_single_speaker(combined_text, voice)
+            (voice,) = voices.values()
+            combined_text = " ".join(line.text for line in chunk.lines)
+            request = [("", voice, combined_text)]
+
+            def generate():
+                return self.provider.generate_single_speaker(combined_text, voice)
         else:
             # Multiple speakers
-            raw_audio = self.provider.generate_multi_speaker(dialogue)
+            dialogue = [(line.speaker, voices[line.speaker], line.text) for line in chunk.lines]
+            request = dialogue
+
+            def generate():
+                return self.provider.generate_multi_speaker(dialogue)
+
+        if self.cache is not None:
+            key = SegmentCache.make_key(self.provider, request)
+            raw_audio = self.cache.get_or_compute(key, generate)
+        else:
+            raw_audio = generate()
 
         return convert_raw_to_pydub(raw_audio)
 
-    def _append_audio(self, audio: PydubSegment, use_crossfade: bool = False):
+    def _append_audio(
+        self,
+        audio: PydubSegment,
+        use_crossfade: bool = False,
+        prefix: bytes | None = None,
+    ) -> int:
         """Append audio segment to output file with optional crossfade.
 
         For the first chunk, creates a new WAV file. For subsequent chunks,
-        loads the existing audio, applies crossfade at the boundary, and
-        re-exports. This ensures proper audio alignment and prevents
-        artifacts at chunk boundaries.
+        the last crossfade_ms of existing audio, kept in memory from the
+        previous append, is blended with the start of the new audio. The
+        blend and the rest of the new audio are written over that tail in
+        place, straight from their buffers, and the header sizes are patched,
+        so each append costs time proportional to the chunk rather than to
+        the whole file. The file is opened once per run and its data layout
+        tracked in memory; nothing is read back from it after opening.
 
         Args:
             audio: The audio segment to append
             use_crossfade: Whether to apply crossfade at the boundary
+            prefix: Optional PCM in the same format (e.g. a pause) to append
+                before audio, without concatenating the two first
+
+        Returns:
+            Frame index in the output where the appended audio (or prefix) begins
         """
-        if not self.output_path.exists():
+        pieces = [memoryview(audio.raw_data)]
+        if prefix is not None:
+            pieces.insert(0, memoryview(prefix))
+        appended_size = sum(map(len, pieces))
+        frame_size = audio.sample_width * audio.channels
+
+        if self._output is None and not self.output_path.exists():
             # First chunk - create new file with proper WAV header
-            # Store the audio parameters for consistency checking
-            self._audio_params = {
-                'frame_rate': audio.frame_rate,
-                'channels': audio.channels,
-                'sample_width': audio.sample_width,
-            }
-            audio.export(str(self.output_path), format="wav")
-        else:
-            # Load existing audio
-            existing = PydubSegment.from_wav(str(self.output_path))
-
-            # Verify format consistency (should be guaranteed by normalize_audio,
-            # but check anyway for safety)
-            if (existing.frame_rate != audio.frame_rate or
-                existing.channels != audio.channels or
-                existing.sample_width != audio.sample_width):
-                # Normalize the new audio to match existing
-                audio = audio.set_frame_rate(existing.frame_rate)
-                audio = audio.set_channels(existing.channels)
-                audio = audio.set_sample_width(existing.sample_width)
-
-            # Combine with crossfade for smooth transition
-            if use_crossfade and self.crossfade_ms > 0:
-                combined = crossfade_segments(existing, audio, self.crossfade_ms)
-            else:
-                combined = existing + audio
-
-            # Export combined audio
-            combined.export(str(self.output_path), format="wav")
+            with wave.open(str(self.output_path), 'wb') as wav:
+                wav.setnchannels(audio.channels)
+                wav.setsampwidth(audio.sample_width)
+                wav.setframerate(audio.frame_rate)
+                for piece in pieces:
+                    wav.writeframes(piece)
+            self._emit_pcm(0, pieces)
+            return 0
+
+        f = self._open_output()
+        data_offset, data_size = self._data_offset, self._data_size
+
+        # Only the end of the existing audio takes part in a crossfade
+        tail_size = 0
+        if use_crossfade and self.crossfade_ms > 0:
+            tail_size = min(data_size, self._tail_bytes)
+        tail_start = data_size - tail_size
+
+        # Frames to blend: crossfade_ms, limited by both sides, and none under 5ms
+        overlap = min(tail_size, appended_size) // frame_size
+        if overlap * 1000 < 5 * audio.frame_rate:
+            overlap = 0
+        overlap *= frame_size
+
+        written = pieces
+        tail = self._prev_tail
+        if overlap:
+            # The overlap may run from the prefix into the audio
+            incoming = b"".join(piece[:overlap] for piece in pieces)[:overlap]
+            written = [
+                memoryview(tail)[:tail_size - overlap],
+                _blend_equal_power(tail[tail_size - overlap:], incoming, audio.channels),
+            ]
+            skip = overlap
+            for piece in pieces:
+                if skip < len(piece):
+                    written.append(piece[skip:])
+                skip = max(0, skip - len(piece))
+
+        f.seek(data_offset + tail_start)
+        for piece in written:
+            f.write(piece)
+        new_size = tail_start + sum(map(len, written))
+        # Keep the header current and hand the data to the OS before state is
+        # saved, so an interrupted run leaves a valid, resumable WAV
+        _patch_wav_sizes(f, data_offset, new_size)
+        f.flush()
+        self._data_size = new_size
+        # Whatever precedes the rewritten region is unchanged
+        self._prev_tail = _last_bytes(
+            [memoryview(tail)[:len(tail) - tail_size], *written],
+            self._tail_bytes,
+        )
+
+        self._emit_pcm(tail_start, written)
+        # Crossfading overlaps the new audio with the end of the existing audio
+        return (new_size - appended_size) // frame_size
+
+    def _open_output(self):
+        """Get the output file, opened once per run for in-place appends."""
+        if self._output is None:
+            f = open(self.output_path, 'r+b')
+            self._data_offset, self._data_size = _read_wav_layout(f)
+            # Drops anything a previously interrupted append left past the data
+            f.truncate(self._data_offset + self._data_size)
+            # The one read of existing audio per run, bounded by crossfade_ms
+            tail_size = min(self._data_size, self._tail_bytes)
+            f.seek(self._data_offset + self._data_size - tail_size)
+            self._prev_tail = f.read(tail_size)
+            self._output = f
+        return self._output
+
+    def _close_output(self):
+        """Close the output file if it is open."""
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+            self._prev_tail = b""
+
+    def _emit_pcm(self, offset: int, pieces: list[bytes | memoryview]):
+        """Pass newly final PCM to the audio callback.
+
+        The last crossfade_ms of audio is held back, since the next chunk's
+        crossfade may still rewrite it.
+
+        Args:
+            offset: Byte position of the first piece within the output's PCM data
+            pieces: Consecutive runs of PCM just written from that position
+        """
+        if not self._audio_callback:
+            return
+
+        if self._emitted_bytes < offset:
+            # Resuming: replay the audio written by the previous run first
+            self._emit_file_pcm(stop=offset)
+
+        frame_size = TARGET_SAMPLE_WIDTH * TARGET_CHANNELS
+        end = max(offset + sum(map(len, pieces)) - self._tail_bytes, self._emitted_bytes)
+        # Keep whole frames only
+        end -= (end - self._emitted_bytes) % frame_size
+
+        position = offset
+        for piece in pieces:
+            start = max(self._emitted_bytes, position)
+            stop = min(end, position + len(piece))
+            if stop > start:
+                self._audio_callback(bytes(piece[start - position:stop - position]))
+                self._emitted_bytes = stop
+            position += len(piece)
+
+    def _emit_file_pcm(self, stop: int | None = None):
+        """Pass not-yet-emitted PCM in the output file to the audio callback.
+
+        Args:
+            stop: Byte position in the PCM data to stop at (default: the end)
+        """
+        if not self._audio_callback or not self.output_path.exists():
+            return
+
+        with wave.open(str(self.output_path), 'rb') as wav:
+            frame_size = wav.getsampwidth() * wav.getnchannels()
+            stop = wav.getnframes() if stop is None else stop // frame_size
+            position = self._emitted_bytes // frame_size
+            wav.setpos(min(position, stop))
+            while position < stop:
+                frames = wav.readframes(min(TARGET_SAMPLE_RATE * 60, stop - position))
+                if not frames:
+                    break
+                self._audio_callback(frames)
+                self._emitted_bytes += len(frames)
+                position += len(frames) // frame_size
 
     def _save_state(self, completed: int, total: int):
-        """Save generation state for resume capability."""
+        """Save generation state for resume capability.
+
+        Appends a record to the state journal rather than rewriting the file,
+        compacting it to the latest record every STATE_COMPACT_RECORDS saves.
+        Fields that don't change during a run (output path, total, voice
+        assignments) are only written when they differ from the journal's,
+        so most records hold just the progress. Voice assignments are only
+        copied when the voice manager reports they have changed.
+        """
+        header = self._state_header
+        version = self.voice_manager.assignments_version
+        output_path = str(self.output_path)
+        changed = (
+            header is None
+            or version != self._state_version
+            or header["total_chunks"] != total
+            or header["output_path"] != output_path
+        )
+        if changed:
+            new_header = {
+                "output_path": output_path,
+                "total_chunks": total,
+                "voice_assignments": self.voice_manager.get_all_assignments(),
+            }
+            changed = new_header != header
+            header = new_header
+        compact = self._state_records >= STATE_COMPACT_RECORDS
         state = {
-            "output_path": str(self.output_path),
             "completed_chunks": completed,
-            "total_chunks": total,
-            "voice_assignments": self.voice_manager.get_all_assignments(),
+            "chapter_starts": self.chapter_starts,
             "stats": self.stats,
-            "updated_at": datetime.now().isoformat(),
+            # Epoch seconds, like stats["start_time"]
+            "updated_at": time.time(),
         }
+        if compact or not self._state_records or changed:
+            state = header | state
+        if orjson is not None:
+            record = orjson.dumps(state, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            record = json.dumps(state, separators=(',', ':')).encode() + b'\n'
 
-        with open(self.state_path, 'w') as f:
-            json.dump(state, f, indent=2)
+        if compact:
+            tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+            tmp_path.write_bytes(record)
+            os.replace(tmp_path, self.state_path)
+            self._state_records = 1
+        else:
+            with open(self.state_path, 'ab') as f:
+                f.write(record)
+            self._state_records += 1
+        self._state_header = header
+        self._state_version = version
 
     def _load_state(self) -> dict:
-        """Load saved state."""
-        with open(self.state_path) as f:
-            return json.load(f)
+        """Load saved state, merging the journal's records in order."""
+        state = {}
+        self._state_records = 0
+        # Records are UTF-8 bytes; a torn one may end mid-character
+        with open(self.state_path, 'rb') as f:
+            for line in f:
+                try:
+                    state.update(json.loads(line))
+                except ValueError:
+                    # Torn final record from an interrupted write
+                    continue
+                self._state_records += 1
+        self._state_header = {
+            key: state.get(key)
+            for key in ("output_path", "total_chunks", "voice_assignments")
+        }
+        # Compare the current assignments against the journal's on the next save
+        self._state_version = None
+        return state
 
     def _cleanup_state(self):
         """Remove state file after successful completion."""
         if self.state_path.exists():
             self.state_path.unlink()
+        self._state_records = 0
+        self._state_header = None
+        self._state_version = None
 
     def get_progress_string(self, current: int, total: int) -> str:
         """Get formatted progress string."""
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VoiceInfo:
     """Information about a voice."""
     name: str
@@ -47,8 +50,13 @@ GOOGLE_VOICES: dict[str, VoiceInfo] = {
     "Sulafat": VoiceInfo("Sulafat", "Warm", "female"),
 }
 
-# Default voice assignments for common speaker roles
-DEFAULT_VOICE_ASSIGNMENTS = {
+# Google voices in alphabetical order, sorted once for listings and dropdowns
+SORTED_GOOGLE_VOICES: tuple[VoiceInfo, ...] = tuple(
+    info for _, info in sorted(GOOGLE_VOICES.items())
+)
+
+# Default voice assignments for common speaker roles (read-only, shared by all managers)
+DEFAULT_VOICE_ASSIGNMENTS: Mapping[str, str] = MappingProxyType({
     "Provider": "Charon",  # Professional, informative
     "Doctor": "Charon",
     "Nurse": "Sulafat",  # Warm
@@ -57,10 +65,10 @@ DEFAULT_VOICE_ASSIGNMENTS = {
     "Speaker B": "Puck",  # Upbeat
     "Speaker C": "Fenrir",  # Excitable
     "Speaker D": "Leda",  # Youthful
-}
+})
 
 # Diverse voices for auto-assignment (mix of genders and characteristics)
-AUTO_ASSIGN_VOICES = [
+AUTO_ASSIGN_VOICES: tuple[str, ...] = (
     "Kore",       # Female, Firm
     "Charon",     # Male, Informative
     "Sulafat",    # Female, Warm
@@ -71,7 +79,10 @@ AUTO_ASSIGN_VOICES = [
     "Iapetus",    # Male, Clear
     "Leda",       # Female, Youthful
     "Fenrir",     # Male, Excitable
-]
+)
+
+# Auto-assignment candidates in preference order, each voice once
+_CANDIDATE_VOICES: tuple[str, ...] = tuple(dict.fromkeys(chain(AUTO_ASSIGN_VOICES, GOOGLE_VOICES)))
 
 
 class VoiceManager:
@@ -80,7 +91,21 @@ class VoiceManager:
     def __init__(self, provider: str = "google"):
         self.provider = provider
         self.assignments: dict[str, str] = {}
+        # Bumped whenever assignments change, so callers can skip unchanged snapshots
+        self.assignments_version = 0
         self._used_voices: set[str] = set()
+        # Candidates before this index are all used; voices are never released
+        self._next_candidate = 0
+
+    def _next_free_voice(self) -> str | None:
+        """Get the first unused auto-assignment candidate, or None if all are used."""
+        candidates = _CANDIDATE_VOICES
+        used = self._used_voices
+        i = self._next_candidate
+        while i < len(candidates) and candidates[i] in used:
+            i += 1
+        self._next_candidate = i
+        return candidates[i] if i < len(candidates) else None
 
     def assign_voice(self, speaker: str, voice: str | None = None) -> str:
         """Assign a voice to a speaker.
@@ -90,6 +115,7 @@ class VoiceManager:
         if speaker in self.assignments:
             return self.assignments[speaker]
 
+        self.assignments_version += 1
         if voice:
             self.assignments[speaker] = voice
             self._used_voices.add(voice)
@@ -103,36 +129,62 @@ class VoiceManager:
                 self._used_voices.add(default)
                 return default
 
-        # Auto-assign from available voices
-        for voice in AUTO_ASSIGN_VOICES:
-            if voice not in self._used_voices:
-                self.assignments[speaker] = voice
-                self._used_voices.add(voice)
-                return voice
-
-        # Fallback: use first available Google voice
-        for voice in GOOGLE_VOICES:
-            if voice not in self._used_voices:
-                self.assignments[speaker] = voice
-                self._used_voices.add(voice)
-                return voice
+        # Auto-assign from available voices, then any Google voice
+        voice = self._next_free_voice()
+        if voice is not None:
+            self.assignments[speaker] = voice
+            self._used_voices.add(voice)
+            return voice
 
         # Last resort: reuse a voice
         fallback = AUTO_ASSIGN_VOICES[0]
         self.assignments[speaker] = fallback
         return fallback
 
+    def assign_voices_bulk(self, speakers: Iterable[str]) -> dict[str, str]:
+        """Auto-assign voices to many speakers in one pass.
+
+        Gives the same result as calling assign_voice on each speaker in
+        order, without the per-speaker method call. Repeated and
+        already-assigned speakers are skipped.
+
+        Returns:
+            Assignments made by this call
+        """
+        assignments = self.assignments
+        used = self._used_voices
+        new: dict[str, str] = {}
+
+        for speaker in speakers:
+            if speaker in assignments or speaker in new:
+                continue
+
+            voice = DEFAULT_VOICE_ASSIGNMENTS.get(speaker)
+            if voice is None or voice in used:
+                # Next free voice, reusing one as a last resort when all are taken
+                voice = self._next_free_voice() or AUTO_ASSIGN_VOICES[0]
+
+            new[speaker] = voice
+            used.add(voice)
+
+        if new:
+            assignments.update(new)
+            self.assignments_version += 1
+        return new
+
     def get_voice(self, speaker: str) -> str:
         """Get the assigned voice for a speaker."""
-        if speaker not in self.assignments:
+        voice = self.assignments.get(speaker)
+        if voice is None:
             return self.assign_voice(speaker)
-        return self.assignments[speaker]
+        return voice
 
     def set_manual_assignments(self, assignments: dict[str, str]):
         """Set manual voice assignments."""
         for speaker, voice in assignments.items():
             self.assignments[speaker] = voice
             self._used_voices.add(voice)
+        self.assignments_version += 1
 
     def get_all_assignments(self) -> dict[str, str]:
         """Get all current voice assignments."""